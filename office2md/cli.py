@@ -1,19 +1,49 @@
 """Command-line interface for office2md."""
 
 import argparse
+import functools
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional, Set, Tuple
 
 from office2md.__version__ import __version__
-from office2md.converter_factory import ConverterFactory
+from office2md.converter_factory import (
+    EXTENSION_KINDS,
+    SUPPORTED_EXTS,
+    ConverterFactory,
+    detect_file_kind,
+)
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
 
 logger = logging.getLogger(__name__)
 
+# Batch job: (input path, output path, lowercase extension, converter options,
+# force re-conversion of up-to-date outputs)
+BatchTask = Tuple[str, str, str, Dict[str, Any], bool]
 
-def parse_args(args=None) -> argparse.Namespace:
-    """Parse command line arguments."""
+# Options understood by every converter
+_COMMON_KWARGS = ("extract_images", "skip_images", "images_dir", "use_docling")
+
+# Options forwarded to convert_file for each input extension
+_KWARGS_BY_EXTENSION = {
+    ".docx": _COMMON_KWARGS + (
+        "use_pandoc", "use_mammoth", "use_basic", "low_memory_docx", "pandoc_server_url",
+    ),
+    ".xlsx": _COMMON_KWARGS + ("include_all_sheets", "read_only"),
+    ".xls": _COMMON_KWARGS + ("include_all_sheets", "read_only"),
+    ".pptx": _COMMON_KWARGS + ("include_notes",),
+    ".ppt": _COMMON_KWARGS + ("include_notes",),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once and reuse it for every parse."""
     parser = argparse.ArgumentParser(
         description="Convert Office documents to Markdown",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -30,12 +60,28 @@ Examples:
     office2md document.docx --use-pandoc      # Best tables
     office2md document.docx --use-mammoth     # Good formatting
     office2md document.docx --use-basic       # Fallback only
+    office2md document.docx --low-memory-docx # Huge files, bounded memory
     
     # PDF with Docling
     office2md document.pdf --use-docling
     
     # Batch conversion
     office2md --batch ./input -o ./output --recursive
+    
+    # Batch conversion with 4 worker processes
+    office2md --batch ./input -o ./output --jobs 4
+    
+    # Batch conversion of many small files on slow storage
+    office2md --batch ./input -o ./output --executor thread
+    
+    # Run many Pandoc conversions concurrently from one process
+    office2md --batch ./input -o ./output --use-pandoc --executor async
+    
+    # Share one long-lived Pandoc process across the whole batch
+    office2md --batch ./input -o ./output --pandoc-server
+    
+    # Re-convert everything, including files whose output is up to date
+    office2md --batch ./input -o ./output --force
         """
     )
     
@@ -80,7 +126,13 @@ Examples:
     converter_group.add_argument(
         "--use-basic",
         action="store_true",
-        help="Force basic python-docx converter (skip Pandoc and Mammoth)"
+        help="Force basic converter (direct XML extraction, skip Pandoc and Mammoth)"
+    )
+    
+    converter_group.add_argument(
+        "--low-memory-docx",
+        action="store_true",
+        help="Stream DOCX XML with a low-memory parser (no image extraction)"
     )
     
     converter_group.add_argument(
@@ -89,6 +141,27 @@ Examples:
         help="Use Docling converter (PDF only, ML-based)"
     )
     
+    converter_group.add_argument(
+        "--force-ocr",
+        action="store_true",
+        help="With --use-docling, always run OCR (default: only for PDFs without a text layer)"
+    )
+    
+    converter_group.add_argument(
+        "--pdf-backend",
+        choices=["pypdfium2", "dlparse_v2", "dlparse_v4", "docling"],
+        default="pypdfium2",
+        help="With --use-docling, PDF parsing backend; 'docling' keeps Docling's default (default: pypdfium2)"
+    )
+    
+    converter_group.add_argument(
+        "--ocr-jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="With --use-docling, OCR page ranges on N processes, each loading its own models (default: 1)"
+    )
+    
     # Image options
     image_group = parser.add_argument_group("Image Options")
     
@@ -118,6 +191,37 @@ Examples:
         help="Process subdirectories recursively"
     )
     
+    batch_group.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of parallel workers (default: CPU count)"
+    )
+    
+    batch_group.add_argument(
+        "--executor",
+        choices=["process", "thread", "async"],
+        default="process",
+        help="Worker pool type: 'process' is best for Pandoc/Docling-heavy "
+             "workloads, 'thread' for many small files on slow storage, "
+             "'async' runs Pandoc subprocesses concurrently from one "
+             "process (default: process)"
+    )
+    
+    batch_group.add_argument(
+        "--force",
+        action="store_true",
+        help="Convert every file, even if its Markdown output is newer "
+             "than the input (default: skip up-to-date outputs)"
+    )
+    
+    batch_group.add_argument(
+        "--pandoc-server",
+        action="store_true",
+        help="Convert DOCX through one shared 'pandoc server' process "
+             "instead of starting Pandoc per file (requires Pandoc 3+)"
+    )
+    
     # Format-specific options
     format_group = parser.add_argument_group("Format-Specific Options")
     
@@ -127,18 +231,50 @@ Examples:
         help="XLSX: Convert only the first sheet"
     )
     
+    format_group.add_argument(
+        "--xlsx-read-only",
+        dest="xlsx_read_only",
+        action="store_true",
+        default=True,
+        help="XLSX: Stream workbooks in low-memory read-only mode (default)"
+    )
+    
+    format_group.add_argument(
+        "--xlsx-full-mode",
+        dest="xlsx_read_only",
+        action="store_false",
+        help="XLSX: Load the full workbook model (higher memory use)"
+    )
+    
     format_group.add_argument(
         "--no-notes",
         action="store_true",
         help="PPTX: Skip speaker notes"
     )
     
-    return parser.parse_args(args)
+    return parser
+
+
+def parse_args(args=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    return _build_parser().parse_args(args)
 
 
 def setup_logging(verbose: bool = False):
-    """Setup logging configuration."""
+    """
+    Setup logging configuration.
+
+    Safe to call repeatedly (e.g. when main() runs several times in one
+    process): handlers are installed once and later calls only adjust
+    the level.
+    """
     level = logging.DEBUG if verbose else logging.INFO
+    root = logging.getLogger()
+    
+    if root.handlers:
+        root.setLevel(level)
+        return
+    
     logging.basicConfig(
         level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -152,22 +288,26 @@ def convert_file(
     use_mammoth: bool = False,
     use_basic: bool = False,
     use_docling: bool = False,
+    low_memory_docx: bool = False,
+    ext: Optional[str] = None,
     **kwargs
 ) -> bool:
     """
     Convert a single file to Markdown.
 
+    ``ext`` may be passed by callers that already know the lowercase
+    extension (batch mode) to skip re-deriving it from the path.
+
     Returns:
         True if conversion was successful, False otherwise.
     """
     try:
-        input_file = Path(input_path)
-        
-        if not input_file.exists():
+        if not os.path.exists(input_path):
             logger.error(f"File not found: {input_path}")
             return False
         
-        ext = input_file.suffix.lower()
+        if ext is None:
+            ext = os.path.splitext(input_path)[1].lower()
         
         # Validate Docling usage (PDF only)
         if use_docling:
@@ -181,6 +321,11 @@ def convert_file(
             from office2md.converters.docling_converter import DoclingConverter
             converter = DoclingConverter(input_path, output_path, **kwargs)
         
+        # DOCX with bounded memory
+        elif ext == '.docx' and low_memory_docx:
+            from office2md.converters.streaming_docx_converter import StreamingDocxConverter
+            converter = StreamingDocxConverter(input_path, output_path, **kwargs)
+        
         # DOCX with specific converter
         elif ext == '.docx':
             from office2md.converters.docx_converter import DocxConverter
@@ -195,10 +340,11 @@ def convert_file(
         
         # Other formats use factory
         else:
-            converter = ConverterFactory.create(input_path, output_path, **kwargs)
+            converter = ConverterFactory.create_converter(
+                input_path, output_path, extension=ext, **kwargs
+            )
         
-        result = converter.convert()
-        converter.save(result)
+        converter.save()
         
         # Log which converter was used
         if hasattr(converter, 'converter_used') and converter.converter_used:
@@ -213,15 +359,284 @@ def convert_file(
         return False
 
 
+def _worker_logging_options() -> Dict[str, Any]:
+    """
+    Pool options that replicate the parent's logging setup in workers.
+
+    Workers started with 'spawn' (macOS/Windows default) do not inherit
+    logging handlers, so configured logging is re-initialized there.
+    """
+    root = logging.getLogger()
+    if not root.handlers:
+        return {}
+    return {
+        "initializer": setup_logging,
+        "initargs": (root.isEnabledFor(logging.DEBUG),),
+    }
+
+
+def _content_matches(input_str: str, ext: str) -> bool:
+    """
+    Check a file's leading bytes against its extension.
+
+    Office lock files like ``~$report.docx`` or truncated downloads fail
+    this check and are skipped instead of being handed to a converter
+    that would fail on them.
+    """
+    if detect_file_kind(input_str) is EXTENSION_KINDS.get(ext):
+        return True
+    logger.warning(f"Skipping {input_str}: content does not match extension")
+    return False
+
+
+def _is_up_to_date(input_str: str, output_str: str) -> bool:
+    """Check whether the output exists and is at least as new as the input."""
+    try:
+        return os.stat(output_str).st_mtime >= os.stat(input_str).st_mtime
+    except OSError:
+        return False
+
+
+def _should_skip(task: BatchTask) -> bool:
+    """Check whether a batch job can be skipped without converting."""
+    input_str, output_str, ext, _, force = task
+    
+    if not force and _is_up_to_date(input_str, output_str):
+        logger.debug(f"Up to date: {input_str}")
+        return True
+    
+    return not _content_matches(input_str, ext)
+
+
+def _convert_worker(args: BatchTask) -> Optional[bool]:
+    """
+    Unpack a batch job and convert it (top-level so it can be pickled).
+
+    The skip checks run here rather than during discovery so that their
+    per-file stat/open/read calls overlap across workers.
+
+    Returns:
+        True/False for success/failure, None if the file was skipped
+    """
+    if _should_skip(args):
+        return None
+    input_str, output_str, ext, kwargs, _ = args
+    return convert_file(input_str, output_str, ext=ext, **kwargs)
+
+
+def _count_results(results: Iterable[Optional[bool]]) -> Tuple[int, int, int]:
+    """
+    Count batch results.
+
+    Returns:
+        Tuple of (success_count, failure_count, skipped_count)
+    """
+    success = 0
+    failure = 0
+    skipped = 0
+    for ok in results:
+        if ok is None:
+            skipped += 1
+            continue
+        if ok:
+            success += 1
+        else:
+            failure += 1
+        logger.debug(f"Progress: {success + failure} file(s) processed")
+    return success, failure, skipped
+
+
+def _iter_pool_results(
+    pool: "Executor",
+    tasks: Iterable[BatchTask],
+    max_pending: int,
+) -> Iterator[Optional[bool]]:
+    """
+    Run batch jobs on a pool, yielding results as soon as each finishes.
+
+    At most ``max_pending`` jobs are submitted ahead of completion, so
+    discovery keeps streaming instead of queuing every file up front (as
+    ``Executor.map`` does), and a slow file never holds back the results
+    of those after it. Outstanding jobs are cancelled if iteration stops
+    early, e.g. on KeyboardInterrupt.
+    """
+    from concurrent.futures import FIRST_COMPLETED, as_completed, wait
+    
+    pending = set()
+    try:
+        for task in tasks:
+            pending.add(pool.submit(_convert_worker, task))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        
+        for future in as_completed(pending):
+            yield future.result()
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        raise
+
+
+async def _convert_file_async(
+    task: BatchTask,
+    semaphore: "asyncio.Semaphore",
+) -> Optional[bool]:
+    """
+    Convert one batch job, awaiting Pandoc instead of blocking on it.
+
+    File system work (skip checks, saving) runs in the loop's default
+    executor so it does not stall other jobs.
+    """
+    import asyncio
+    
+    input_str, output_str, ext, kwargs, _ = task
+    loop = asyncio.get_running_loop()
+    
+    async with semaphore:
+        if await loop.run_in_executor(None, _should_skip, task):
+            return None
+        
+        if (
+            ext != '.docx'
+            or kwargs.get('use_docling')
+            or kwargs.get('low_memory_docx')
+        ):
+            return await loop.run_in_executor(
+                None, functools.partial(convert_file, input_str, output_str, ext=ext, **kwargs)
+            )
+        
+        try:
+            from office2md.converters.docx_converter import DocxConverter
+            
+            docx_kwargs = {k: v for k, v in kwargs.items() if k != 'use_docling'}
+            converter = DocxConverter(input_str, output_str, **docx_kwargs)
+            result = await converter.convert_async()
+            await loop.run_in_executor(None, converter.save, result)
+            
+            logger.info(f"Converted with {converter.converter_used}: {input_str}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to convert {input_str}: {e}")
+            return False
+
+
+async def batch_convert_async(
+    tasks: Iterable[BatchTask],
+    jobs: int,
+) -> Tuple[int, int, int]:
+    """
+    Run batch jobs concurrently on an event loop, at most ``jobs`` at a time.
+
+    Returns:
+        Tuple of (success_count, failure_count, skipped_count)
+    """
+    import asyncio
+    
+    semaphore = asyncio.Semaphore(jobs)
+    results = await asyncio.gather(
+        *(_convert_file_async(task, semaphore) for task in tasks)
+    )
+    return _count_results(results)
+
+
+def _iter_supported(root: Path, recursive: bool = False) -> Iterator[Path]:
+    """
+    Yield supported files under root using os.scandir.
+
+    Directory entries carry their file type from readdir, so only
+    candidates with a supported extension are stat-ed or wrapped in Path.
+    """
+    stack = [os.fspath(root)]
+    
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif (
+                        os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTS
+                        and entry.is_file()
+                    ):
+                        yield Path(entry.path)
+        except OSError as e:
+            logger.warning(f"Cannot scan directory: {e}")
+
+
+def _filter_kwargs(ext: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the options relevant to files with the given extension."""
+    allowed = _KWARGS_BY_EXTENSION.get(ext)
+    if allowed is None:
+        return dict(kwargs)
+    return {k: v for k, v in kwargs.items() if k in allowed}
+
+
+def _iter_batch_tasks(
+    files: Iterable[Path],
+    input_path: Path,
+    output_path: Path,
+    recursive: bool,
+    kwargs: Dict[str, Any],
+    force: bool = False,
+) -> Iterator[BatchTask]:
+    """
+    Yield (input, output, ext, kwargs, force) batch jobs as files are discovered.
+
+    Options are filtered down to those relevant for each extension once,
+    and the same dict is shared by every job of that extension.
+    """
+    kwargs_by_extension: Dict[str, Dict[str, Any]] = {}
+    created_dirs: Set[Path] = set()
+    
+    for file in files:
+        ext = file.suffix.lower()
+        
+        file_kwargs = kwargs_by_extension.get(ext)
+        if file_kwargs is None:
+            file_kwargs = kwargs_by_extension[ext] = _filter_kwargs(ext, kwargs)
+        
+        # Calculate output path
+        if recursive:
+            rel_path = file.relative_to(input_path)
+            out_file = output_path / rel_path.with_suffix('.md')
+        else:
+            out_file = output_path / file.with_suffix('.md').name
+        
+        # Ensure output directory exists (once per directory)
+        if out_file.parent not in created_dirs:
+            out_file.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(out_file.parent)
+        
+        yield str(file), str(out_file), ext, file_kwargs, force
+
+
 def batch_convert(
     input_dir: str,
     output_dir: Optional[str] = None,
     recursive: bool = False,
+    jobs: Optional[int] = None,
+    executor: str = "process",
+    pandoc_server: bool = False,
+    force: bool = False,
     **kwargs
 ) -> Tuple[int, int]:
     """
     Convert multiple files in a directory.
 
+    Files are independent, so they are converted in parallel. ``executor``
+    selects a process pool (CPU-bound work), a thread pool (I/O-bound
+    work, e.g. many small files on network storage) or an asyncio event
+    loop driving Pandoc subprocesses. Use ``jobs=1`` to convert
+    sequentially in-process. With ``pandoc_server`` a single ``pandoc
+    server`` process is started and shared by every DOCX conversion.
+
+    Conversion is incremental: files whose Markdown output is already at
+    least as new as the input are skipped. Pass ``force=True`` to convert
+    everything.
+
     Returns:
         Tuple of (success_count, failure_count)
     """
@@ -232,41 +647,72 @@ def batch_convert(
         logger.error(f"Not a directory: {input_dir}")
         return 0, 1
     
-    # Find all supported files
-    pattern = "**/*" if recursive else "*"
-    files = [
-        f for f in input_path.glob(pattern)
-        if f.is_file() and ConverterFactory.is_supported(str(f))
-    ]
+    if pandoc_server:
+        from office2md.converters.pandoc_converter import PandocServer
+        
+        server = PandocServer()
+        try:
+            server.start()
+        except RuntimeError as e:
+            logger.warning(f"Pandoc server unavailable, converting per file: {e}")
+        else:
+            try:
+                return batch_convert(
+                    input_dir,
+                    output_dir,
+                    recursive,
+                    jobs=jobs,
+                    executor=executor,
+                    force=force,
+                    pandoc_server_url=server.url,
+                    **kwargs
+                )
+            finally:
+                server.stop()
     
-    if not files:
-        logger.warning(f"No supported files found in {input_dir}")
-        return 0, 0
+    # Discover supported files lazily so conversion starts immediately
+    files = _iter_supported(input_path, recursive)
+    tasks = _iter_batch_tasks(files, input_path, output_path, recursive, kwargs, force)
     
-    success = 0
-    failure = 0
+    jobs = jobs or os.cpu_count() or 1
     
-    for file in files:
-        # Calculate output path
-        if recursive:
-            rel_path = file.relative_to(input_path)
-            out_file = output_path / rel_path.with_suffix('.md')
-        else:
-            out_file = output_path / file.with_suffix('.md').name
-        
-        # Ensure output directory exists
-        out_file.parent.mkdir(parents=True, exist_ok=True)
+    if executor == "async":
+        import asyncio
         
-        if convert_file(str(file), str(out_file), **kwargs):
-            success += 1
+        success, failure, skipped = asyncio.run(batch_convert_async(tasks, jobs))
+    elif jobs <= 1:
+        success, failure, skipped = _count_results(map(_convert_worker, tasks))
+    else:
+        if executor == "thread":
+            from concurrent.futures import ThreadPoolExecutor
+            
+            pool = ThreadPoolExecutor(max_workers=jobs)
         else:
-            failure += 1
+            from concurrent.futures import ProcessPoolExecutor
+            
+            pool = ProcessPoolExecutor(max_workers=jobs, **_worker_logging_options())
+        with pool:
+            success, failure, skipped = _count_results(
+                _iter_pool_results(pool, tasks, max_pending=jobs * 2)
+            )
+    
+    if success + failure + skipped == 0:
+        logger.warning(f"No supported files found in {input_dir}")
+    elif skipped:
+        logger.info(f"Skipped {skipped} file(s) (up to date or content not matching extension)")
     
     return success, failure
 
 
 def main(args=None) -> int:
     """Main entry point."""
+    # Optional shell completion (pip install argcomplete)
+    try:
+        import argcomplete
+        argcomplete.autocomplete(_build_parser())
+    except ImportError:
+        pass
+    
     parsed = parse_args(args)
     
     setup_logging(parsed.verbose)
@@ -293,15 +739,25 @@ def main(args=None) -> int:
     if parsed.first_sheet_only:
         kwargs["include_all_sheets"] = False
     
+    kwargs["read_only"] = parsed.xlsx_read_only
+    
     if parsed.no_notes:
         kwargs["include_notes"] = False
     
+    if parsed.force_ocr:
+        kwargs["force_ocr"] = True
+    
+    if parsed.use_docling:
+        kwargs["pdf_backend"] = None if parsed.pdf_backend == "docling" else parsed.pdf_backend
+        kwargs["ocr_parallelism"] = parsed.ocr_jobs
+    
     # Converter flags
     converter_kwargs = {
         "use_pandoc": parsed.use_pandoc,
         "use_mammoth": parsed.use_mammoth,
         "use_basic": parsed.use_basic,
         "use_docling": parsed.use_docling,
+        "low_memory_docx": parsed.low_memory_docx,
     }
     
     if parsed.batch:
@@ -309,6 +765,10 @@ def main(args=None) -> int:
             parsed.input,
             parsed.output,
             parsed.recursive,
+            jobs=parsed.jobs,
+            executor=parsed.executor,
+            pandoc_server=parsed.pandoc_server,
+            force=parsed.force,
             **kwargs,
             **converter_kwargs
         )
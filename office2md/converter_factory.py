@@ -1,28 +1,109 @@
 """Factory for creating appropriate converters based on file type."""
 
+import importlib
+import os
+from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Type, Union
 
 from office2md.converters.base_converter import BaseConverter
-from office2md.converters.docx_converter import DocxConverter
-from office2md.converters.pptx_converter import PptxConverter
-from office2md.converters.xlsx_converter import XlsxConverter
+
+
+class FileKind(Enum):
+    """Container format of a file, as identified by its leading bytes."""
+
+    ZIP = "zip"  # OOXML package: DOCX, XLSX, PPTX
+    PDF = "pdf"
+    OLE = "ole"  # Legacy Office compound file: DOC, XLS, PPT
+    UNKNOWN = "unknown"
+
+
+# Leading bytes identifying each container format
+_MAGIC_NUMBERS = (
+    (b"PK\x03\x04", FileKind.ZIP),
+    (b"%PDF", FileKind.PDF),
+    (b"\xd0\xcf\x11\xe0", FileKind.OLE),
+)
+
+# Container format expected for each supported extension
+EXTENSION_KINDS = {
+    ".docx": FileKind.ZIP,
+    ".xlsx": FileKind.ZIP,
+    ".pptx": FileKind.ZIP,
+    ".xls": FileKind.OLE,
+    ".ppt": FileKind.OLE,
+    ".pdf": FileKind.PDF,
+}
+
+
+def detect_file_kind(file_path: Union[str, Path]) -> FileKind:
+    """
+    Identify a file's container format from its first four bytes.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        The detected FileKind, or FileKind.UNKNOWN if unreadable/unrecognized
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return FileKind.UNKNOWN
+
+    try:
+        header = os.read(fd, 4)
+    finally:
+        os.close(fd)
+
+    for magic, kind in _MAGIC_NUMBERS:
+        if header == magic:
+            return kind
+    return FileKind.UNKNOWN
 
 
 class ConverterFactory:
-    """Factory class for creating appropriate converters."""
+    """
+    Factory class for creating appropriate converters.
+
+    ``SUPPORTED_EXTENSIONS`` maps each extension to a converter class or to
+    a ``"module:Class"`` path; paths are imported on first use so only the
+    backend actually needed is loaded.
+    """
 
     SUPPORTED_EXTENSIONS = {
-        ".docx": DocxConverter,
-        ".xlsx": XlsxConverter,
-        ".xls": XlsxConverter,
-        ".pptx": PptxConverter,
-        ".ppt": PptxConverter,
+        ".docx": "office2md.converters.docx_converter:DocxConverter",
+        ".xlsx": "office2md.converters.xlsx_converter:XlsxConverter",
+        ".xls": "office2md.converters.xlsx_converter:XlsxConverter",
+        ".pptx": "office2md.converters.pptx_converter:PptxConverter",
+        ".ppt": "office2md.converters.pptx_converter:PptxConverter",
     }
 
+    @classmethod
+    def get_converter_class(cls, extension: str) -> Optional[Type[BaseConverter]]:
+        """
+        Resolve the converter class registered for an extension.
+
+        Args:
+            extension: Lowercase file extension including the dot
+
+        Returns:
+            The converter class, or None if the extension is not supported
+        """
+        converter = cls.SUPPORTED_EXTENSIONS.get(extension)
+        if isinstance(converter, str):
+            module_name, _, class_name = converter.partition(":")
+            converter = getattr(importlib.import_module(module_name), class_name)
+            cls.SUPPORTED_EXTENSIONS[extension] = converter
+        return converter
+
     @classmethod
     def create_converter(
-        cls, input_path: str, output_path: Optional[str] = None, **kwargs
+        cls,
+        input_path: Union[str, Path],
+        output_path: Optional[Union[str, Path]] = None,
+        extension: Optional[str] = None,
+        **kwargs
     ) -> BaseConverter:
         """
         Create an appropriate converter based on file extension.
@@ -30,6 +111,8 @@ class ConverterFactory:
         Args:
             input_path: Path to the input file
             output_path: Optional path for the output Markdown file
+            extension: Lowercase extension including the dot, if the caller
+                already has it; derived from input_path otherwise
             **kwargs: Additional arguments to pass to the converter
 
         Returns:
@@ -38,10 +121,10 @@ class ConverterFactory:
         Raises:
             ValueError: If file extension is not supported
         """
-        file_path = Path(input_path)
-        extension = file_path.suffix.lower()
+        if extension is None:
+            extension = os.path.splitext(input_path)[1].lower()
 
-        converter_class = cls.SUPPORTED_EXTENSIONS.get(extension)
+        converter_class = cls.get_converter_class(extension)
         if not converter_class:
             supported = ", ".join(cls.SUPPORTED_EXTENSIONS.keys())
             raise ValueError(
@@ -61,5 +144,9 @@ class ConverterFactory:
         Returns:
             True if the file type is supported, False otherwise
         """
-        extension = Path(file_path).suffix.lower()
+        extension = os.path.splitext(file_path)[1].lower()
         return extension in cls.SUPPORTED_EXTENSIONS
+
+
+# Lowercase suffixes handled by the factory, for cheap membership checks
+SUPPORTED_EXTS = frozenset(ConverterFactory.SUPPORTED_EXTENSIONS)
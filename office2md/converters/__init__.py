@@ -1,38 +1,60 @@
-"""Converters package for office2md."""
+"""Converters package for office2md.
+
+Converter classes are imported on first access (PEP 562) so that importing
+the package, or any single converter module, does not pull in every
+backend library.
+"""
+
+import importlib
 
 from office2md.converters.base_converter import BaseConverter
-from office2md.converters.docx_converter import DocxConverter
-from office2md.converters.xlsx_converter import XlsxConverter
-from office2md.converters.pptx_converter import PptxConverter
-
-# Optional converters
-try:
-    from office2md.converters.pandoc_converter import PandocConverter
-except ImportError:
-    PandocConverter = None
-
-try:
-    from office2md.converters.mammoth_converter import MammothConverter
-except ImportError:
-    MammothConverter = None
-
-try:
-    from office2md.converters.basic_docx_converter import BasicDocxConverter
-except ImportError:
-    BasicDocxConverter = None
-
-try:
-    from office2md.converters.docling_converter import DoclingConverter
-except ImportError:
-    DoclingConverter = None
+
+# Exported name -> defining module
+_CONVERTER_MODULES = {
+    "DocxConverter": "office2md.converters.docx_converter",
+    "XlsxConverter": "office2md.converters.xlsx_converter",
+    "PptxConverter": "office2md.converters.pptx_converter",
+    "StreamingDocxConverter": "office2md.converters.streaming_docx_converter",
+}
+
+# Optional converters resolve to None when their dependencies are missing
+_OPTIONAL_CONVERTER_MODULES = {
+    "PandocConverter": "office2md.converters.pandoc_converter",
+    "MammothConverter": "office2md.converters.mammoth_converter",
+    "BasicDocxConverter": "office2md.converters.basic_docx_converter",
+    "FastDocxConverter": "office2md.converters.fast_docx_converter",
+    "DoclingConverter": "office2md.converters.docling_converter",
+}
+
+
+def __getattr__(name):
+    if name in _CONVERTER_MODULES:
+        value = getattr(importlib.import_module(_CONVERTER_MODULES[name]), name)
+    elif name in _OPTIONAL_CONVERTER_MODULES:
+        try:
+            value = getattr(importlib.import_module(_OPTIONAL_CONVERTER_MODULES[name]), name)
+        except ImportError:
+            value = None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
+
 
 __all__ = [
     "BaseConverter",
     "DocxConverter",
     "XlsxConverter",
     "PptxConverter",
+    "StreamingDocxConverter",
     "PandocConverter",
     "MammothConverter",
     "BasicDocxConverter",
+    "FastDocxConverter",
     "DoclingConverter",
 ]
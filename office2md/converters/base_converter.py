@@ -1,15 +1,187 @@
 """Base converter class for office2md."""
 
-import base64
+import binascii
+import contextlib
 import hashlib
+import io
 import logging
+import mmap
+import os
 import re
+import shutil
+import zipfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+# Threads used to write extracted images; writes release the GIL
+IMAGE_WRITE_WORKERS = 4
+
+# Chunk size used when streaming extracted images to disk
+IMAGE_COPY_BUFFER_SIZE = 1 << 20
+
+# Characters encoded per write when saving Markdown text
+TEXT_ENCODE_CHUNK_SIZE = 1 << 20
+
+# zlib level for PNGs encoded from PIL images (fast, slightly larger files)
+PNG_COMPRESS_LEVEL = 1
+
+# Encoded formats whose source bytes can be saved without re-encoding
+_PIL_FORMAT_EXTENSIONS = {"PNG": "png", "JPEG": "jpg"}
+_IMAGE_SIGNATURES = {"png": b"\x89PNG\r\n\x1a\n", "jpg": b"\xff\xd8"}
+
+# Inline base64 images: png, jpg, jpeg, gif, svg+xml, webp with optional
+# whitespace; ')' never occurs in base64, so the payload is simply [^)]+
+_B64_IMG_RE = re.compile(r"!\[([^\]]*)\]\(data:image/([a-zA-Z0-9+]+);base64,([^)]+)\)")
+
+# Any Markdown image reference
+_IMG_STRIP_RE = re.compile(r"!\[.*?\]\(.*?\)")
+
+# Runs of asterisks left by adjacent bold/italic runs
+_EXCESS_ASTERISKS_RE = re.compile(r"\*{4,}")
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write a whole buffer to a raw file descriptor, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _open_for_write(path) -> int:
+    """Open (create or truncate) a file for writing as a raw descriptor."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    return os.open(path, flags, 0o644)
+
+
+def _write_file(path, data: bytes) -> None:
+    """
+    Write a complete blob to a file through a raw file descriptor.
+
+    The data is already in memory as one buffer, so it is handed straight
+    to os.write() rather than copied through a BufferedWriter first.
+    """
+    fd = _open_for_write(path)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_files(writes: List[Tuple[str, bytes]]) -> List[str]:
+    """
+    Write several (path, data) blobs, concurrently when there is more than one.
+
+    Each failure is logged and skipped so one bad image does not stop the rest.
+
+    Returns:
+        Paths that could not be written, in the order given.
+    """
+    failed = []
+    if len(writes) > 1:
+        with ThreadPoolExecutor(max_workers=min(IMAGE_WRITE_WORKERS, len(writes))) as pool:
+            futures = [pool.submit(_write_file, path, data) for path, data in writes]
+            for (path, _), future in zip(writes, futures):
+                try:
+                    future.result()
+                except OSError as e:
+                    logger.warning(f"Failed to write image {path}: {e}")
+                    failed.append(path)
+    else:
+        for path, data in writes:
+            try:
+                _write_file(path, data)
+            except OSError as e:
+                logger.warning(f"Failed to write image {path}: {e}")
+                failed.append(path)
+    return failed
+
+
+def _write_text(path, text: str) -> None:
+    """
+    Write text to a file as UTF-8 through a raw file descriptor.
+
+    The text is encoded in slices of TEXT_ENCODE_CHUNK_SIZE characters, so
+    only one slice's bytes exist alongside the string rather than a full
+    encoded copy of a large document.
+    """
+    fd = _open_for_write(path)
+    try:
+        for start in range(0, len(text), TEXT_ENCODE_CHUNK_SIZE):
+            _write_all(fd, text[start:start + TEXT_ENCODE_CHUNK_SIZE].encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def _b64decode(data) -> bytes:
+    """
+    Decode base64, skipping whitespace and other non-alphabet characters.
+
+    Uses pybase64's SIMD decoder when installed (pip install pybase64).
+    """
+    if PYBASE64_AVAILABLE:
+        return pybase64.b64decode(data, validate=False)
+    return binascii.a2b_base64(data)
+
+
+def _encoded_image_source(pil_image) -> Optional[Tuple[bytes, str]]:
+    """
+    Return the original file bytes and extension of an undecoded PIL image.
+
+    An image opened from PNG or JPEG data that has not been loaded yet
+    (``tile`` still pending) cannot have been modified, so its source
+    bytes can be saved as-is instead of being re-encoded.
+    """
+    extension = _PIL_FORMAT_EXTENSIONS.get(getattr(pil_image, "format", None))
+    fp = getattr(pil_image, "fp", None)
+    if extension is None or fp is None or not getattr(pil_image, "tile", None):
+        return None
+    
+    try:
+        position = fp.tell()
+        fp.seek(0)
+        data = fp.read()
+        fp.seek(position)
+    except (AttributeError, OSError, ValueError):
+        return None
+    
+    if not data.startswith(_IMAGE_SIGNATURES[extension]):
+        return None
+    return data, extension
+
+
+def _encode_pil_image(pil_image) -> Tuple[bytes, str]:
+    """
+    Return file bytes and an extension for a PIL image.
+
+    Undecoded PNG/JPEG images keep their source bytes; anything else is
+    encoded as PNG in memory, so it can be hashed before it is named.
+    """
+    encoded = _encoded_image_source(pil_image)
+    if encoded is not None:
+        return encoded
+    
+    with io.BytesIO() as buffer:
+        pil_image.save(buffer, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+        return buffer.getvalue(), "png"
+
+
+class _SeekableMmap(mmap.mmap):
+    """Memory map usable as a zipfile source (mmap gained seekable() in 3.13)."""
+
+    def seekable(self) -> bool:
+        return True
+
 
 class BaseConverter(ABC):
     """
@@ -21,8 +193,8 @@ class BaseConverter(ABC):
 
     def __init__(
         self,
-        input_path: str,
-        output_path: Optional[str] = None,
+        input_path: Union[str, Path],
+        output_path: Optional[Union[str, Path]] = None,
         extract_images: bool = True,
         skip_images: bool = False,
         images_dir: Optional[Path] = None,
@@ -32,17 +204,18 @@ class BaseConverter(ABC):
         Initialize the converter.
 
         Args:
-            input_path: Path to the input file.
+            input_path: Path to the input file (str or Path).
             output_path: Optional path for the output Markdown file.
             extract_images: Whether to extract images from the document.
             skip_images: Whether to skip image processing entirely.
             images_dir: Custom directory for extracted images.
             **kwargs: Additional format-specific options.
         """
-        self.input_path = Path(input_path)
+        # Reuse Path objects from callers instead of re-parsing them
+        self.input_path = input_path if isinstance(input_path, Path) else Path(input_path)
         
         if output_path:
-            self.output_path = Path(output_path)
+            self.output_path = output_path if isinstance(output_path, Path) else Path(output_path)
         else:
             self.output_path = self.input_path.with_suffix('.md')
         
@@ -57,6 +230,12 @@ class BaseConverter(ABC):
             self.images_dir = self.output_path.parent / f"{self.output_path.stem}_images"
         
         self._image_counter = 0
+        # Content digest -> Markdown reference, so repeated images are written once
+        self.extracted_images: Dict[bytes, str] = {}
+        # Images directory and the Markdown link prefix for its files, as
+        # strings; set up on the first extracted image
+        self._images_dir_str: Optional[str] = None
+        self._image_ref_prefix = "./"
         self._kwargs = kwargs
 
     @abstractmethod
@@ -69,21 +248,27 @@ class BaseConverter(ABC):
         """
         pass
 
-    def save(self, content: str) -> None:
+    def save(self, content: Optional[str] = None) -> None:
         """
         Save the converted content to the output file.
 
+        The document is converted before the output file is opened, so no
+        file handle is held during conversion. The Markdown is encoded and
+        written in slices, so large outputs are never held twice.
+
         Args:
-            content: Markdown string to save.
+            content: Markdown string to save. Converts the document if omitted.
         """
         if not self.output_path:
             raise ValueError("No output path specified for saving.")
         
+        if content is None:
+            content = self.convert()
+        
         # Ensure parent directory exists
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        _write_text(self.output_path, content)
         
         logger.info(f"Saved output to: {self.output_path}")
 
@@ -95,10 +280,39 @@ class BaseConverter(ABC):
                 f"Extracted {len(self.extracted_images)} images to {self.images_dir}"
             )
 
+    @contextlib.contextmanager
+    def _open_package(self) -> Iterator[zipfile.ZipFile]:
+        """
+        Open the input file as a ZIP package backed by a memory map.
+
+        Reads of the central directory and part streams are served from
+        the mapped file instead of through buffered read() calls. Falls
+        back to a regular file for inputs that cannot be mapped (e.g.
+        empty files).
+
+        Yields:
+            An open ZipFile for the input document.
+        """
+        with open(self.input_path, "rb") as f:
+            try:
+                mapped = _SeekableMmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                mapped = None
+            
+            if mapped is None:
+                with zipfile.ZipFile(f) as package:
+                    yield package
+            else:
+                with mapped, zipfile.ZipFile(mapped) as package:
+                    yield package
+
     def _process_image(self, image_data: bytes, extension: str = "png") -> str:
         """
         Process and save an image, returning a Markdown reference.
 
+        Identical images (e.g. a logo repeated on every slide) are written
+        once; later occurrences reference the first saved file.
+
         Args:
             image_data: Raw image bytes.
             extension: Image file extension (png, jpg, etc.).
@@ -109,30 +323,123 @@ class BaseConverter(ABC):
         if self.skip_images or not self.extract_images:
             return ""
         
-        self._image_counter += 1
+        ref, image_path = self._reserve_image(image_data, extension)
+        if image_path is not None:
+            _write_file(image_path, image_data)
         
-        # Ensure images directory exists
-        self.images_dir.mkdir(parents=True, exist_ok=True)
+        return ref
+
+    def _reserve_image(self, image_data: bytes, extension: str) -> Tuple[str, Optional[str]]:
+        """
+        Name an image and record its Markdown reference without writing it.
+
+        Lets callers assign names in document order and write the files
+        afterwards, e.g. concurrently.
+
+        Args:
+            image_data: Raw image bytes.
+            extension: Image file extension (png, jpg, etc.).
+
+        Returns:
+            Tuple of the Markdown reference and the path to write the image
+            to, or None if an identical image was already reserved.
+        """
+        image_key = hashlib.blake2b(image_data, digest_size=16).digest()
+        ref = self.extracted_images.get(image_key)
+        if ref is not None:
+            return ref, None
         
-        # Generate filename
-        image_filename = f"image_{self._image_counter}.{extension}"
-        image_path = self.images_dir / image_filename
+        image_name = self._next_image_name(extension)
+        ref = self.extracted_images[image_key] = self._image_reference(image_name)
+        return ref, os.path.join(self._images_dir_str, image_name)
+
+    def _process_image_stream(self, stream: BinaryIO, extension: str = "png") -> str:
+        """
+        Save an image from a binary stream, returning a Markdown reference.
+
+        The image is copied in large chunks without materializing it in
+        memory, which suits multi-megabyte images read from a package.
+
+        Args:
+            stream: Readable binary file object positioned at the image data.
+            extension: Image file extension (png, jpg, etc.).
+
+        Returns:
+            Markdown image reference string.
+        """
+        if self.skip_images or not self.extract_images:
+            return ""
         
-        # Save image
-        with open(image_path, "wb") as f:
-            f.write(image_data)
+        image_name = self._next_image_name(extension)
+        
+        with open(os.path.join(self._images_dir_str, image_name), "wb") as f:
+            shutil.copyfileobj(stream, f, IMAGE_COPY_BUFFER_SIZE)
+        
+        return self._image_reference(image_name)
+
+    def _next_image_name(self, extension: str) -> str:
+        """Reserve the filename for the next extracted image."""
+        self._ensure_images_dir()
+        
+        self._image_counter += 1
+        return f"image_{self._image_counter}.{extension}"
+
+    def _ensure_images_dir(self) -> None:
+        """Create the images directory once per converter."""
+        if self._images_dir_str is None:
+            self._prepare_images_dir()
+
+    def _prepare_images_dir(self) -> None:
+        """Create the images directory and cache its paths as strings."""
+        self.images_dir.mkdir(parents=True, exist_ok=True)
         
-        # Return relative markdown reference
         try:
-            rel_path = image_path.relative_to(self.output_path.parent)
+            rel_dir = self.images_dir.relative_to(self.output_path.parent)
         except ValueError:
-            rel_path = image_path
+            rel_dir = self.images_dir
+        
+        # Markdown links use forward slashes on every platform
+        self._image_ref_prefix = "./" if rel_dir == Path(".") else f"./{rel_dir.as_posix()}/"
+        self._images_dir_str = os.fspath(self.images_dir)
+
+    def _image_reference(self, image_name: str) -> str:
+        """Build a Markdown reference to a saved image, relative to the output."""
+        return f"![]({self._image_ref_prefix}{image_name})"
+
+    def _tidy_lines(self, markdown: str, fix_emphasis: bool = False) -> str:
+        """
+        Strip trailing whitespace and collapse blank lines in one pass.
+
+        Equivalent to replacing ``\\n{3,}`` with ``\\n\\n`` and rstrip-ing
+        every line, except that whitespace-only lines also count as blank.
+
+        Args:
+            markdown: Markdown to tidy.
+            fix_emphasis: Also shrink runs of four or more asterisks to ``**``.
+
+        Returns:
+            Tidied Markdown.
+        """
+        lines = []
+        blank = False
+        
+        for line in markdown.split('\n'):
+            line = line.rstrip()
+            if not line:
+                if blank:
+                    continue
+                blank = True
+            else:
+                blank = False
+                if fix_emphasis and '****' in line:
+                    line = _EXCESS_ASTERISKS_RE.sub('**', line)
+            lines.append(line)
         
-        return f"![](./{rel_path})"
+        return '\n'.join(lines)
 
     def _generate_image_hash(self, image_data: bytes) -> str:
         """Generate a hash for image data to detect duplicates."""
-        return hashlib.md5(image_data).hexdigest()[:8]
+        return hashlib.blake2b(image_data, digest_size=4).hexdigest()
 
     def _replace_base64_images(self, markdown: str) -> str:
         """
@@ -145,24 +452,21 @@ class BaseConverter(ABC):
             Processed markdown with images handled per mode
         """
         if self.skip_images:
-            return re.sub(r"!\[.*?\]\(.*?\)", "", markdown)
+            return _IMG_STRIP_RE.sub("", markdown)
 
-        if self.embed_images:
+        if self._kwargs.get("embed_images"):
             logger.info("Keeping images as base64 inline")
             return markdown
 
         if self.extract_images:
-            # IMPROVED: More flexible pattern for base64 detection
-            # Handles: png, jpg, jpeg, gif, svg+xml, webp with optional whitespace
-            pattern = r"!\[([^\]]*)\]\(data:image/([a-zA-Z0-9+]+);base64,([A-Za-z0-9+/=\s]+)\)"
-
             def replace_func(match):
                 alt_text = match.group(1)
                 image_format = match.group(2).lower().replace("+xml", "")  # svg+xml -> svg
-                b64_data = match.group(3).replace(" ", "").replace("\n", "").replace("\r", "")
+                b64_data = match.group(3)
 
                 try:
-                    image_data = base64.b64decode(b64_data)
+                    # Non-strict decoding skips embedded whitespace without copying
+                    image_data = _b64decode(b64_data)
                     ref = self._process_image(image_data, image_format)
                     logger.debug(f"Extracted image: format={image_format}, size={len(image_data)} bytes, alt='{alt_text}'")
                     return ref
@@ -170,7 +474,12 @@ class BaseConverter(ABC):
                     logger.warning(f"Failed to decode base64 image: {e}")
                     return ""
 
-            processed = re.sub(pattern, replace_func, markdown)
+            # A plain substring search is much cheaper than running the
+            # pattern over large outputs that contain no inline images
+            if "data:image/" in markdown:
+                processed = _B64_IMG_RE.sub(replace_func, markdown)
+            else:
+                processed = markdown
             
             # Log extraction summary
             if self.extracted_images:
@@ -1,11 +1,10 @@
 """Basic DOCX converter using python-docx (fallback when Pandoc/Mammoth unavailable)."""
 
 import logging
-import re
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional
 
-from office2md.converters.base_converter import BaseConverter
+from office2md.converters.base_converter import BaseConverter, _write_files
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +17,147 @@ try:
 except ImportError:
     PYTHON_DOCX_AVAILABLE = False
 
+# WordprocessingML tags used by the fast table walker
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_BODY = f"{W_NS}body"
+W_TBL = f"{W_NS}tbl"
+W_TR = f"{W_NS}tr"
+W_TC = f"{W_NS}tc"
+W_P = f"{W_NS}p"
+W_R = f"{W_NS}r"
+W_T = f"{W_NS}t"
+W_TAB = f"{W_NS}tab"
+W_BR = f"{W_NS}br"
+W_CR = f"{W_NS}cr"
+W_NO_BREAK_HYPHEN = f"{W_NS}noBreakHyphen"
+W_PTAB = f"{W_NS}ptab"
+W_HYPERLINK = f"{W_NS}hyperlink"
+W_RPR = f"{W_NS}rPr"
+W_B = f"{W_NS}b"
+W_I = f"{W_NS}i"
+# Direct run formatting toggles, as paths relative to a <w:p>
+W_RUN_BOLD = f"{W_R}/{W_NS}rPr/{W_NS}b"
+W_RUN_ITALIC = f"{W_R}/{W_NS}rPr/{W_NS}i"
+W_GRID_SPAN = f"{W_NS}tcPr/{W_NS}gridSpan"
+W_V_MERGE = f"{W_NS}tcPr/{W_NS}vMerge"
+W_VAL = f"{W_NS}val"
+W_TYPE = f"{W_NS}type"
+
+# Values that switch an OOXML on/off property (e.g. <w:b w:val="0"/>) off
+_FALSE_VALUES = ("0", "false", "off")
+
+# Word's built-in heading styles, with and without the space
+_HEADING_LEVELS = {f"Heading {i}": i for i in range(1, 10)}
+_HEADING_LEVELS.update({f"Heading{i}": i for i in range(1, 10)})
+
+
+def _run_xml_text(run) -> str:
+    """Return a <w:r> element's text the way python-docx's Run.text does."""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == W_T:
+            parts.append(child.text or '')
+        elif tag in (W_TAB, W_PTAB):
+            parts.append('\t')
+        elif tag == W_CR:
+            parts.append('\n')
+        elif tag == W_BR:
+            # Page and column breaks have no text equivalent
+            if child.get(W_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif tag == W_NO_BREAK_HYPHEN:
+            parts.append('-')
+    return ''.join(parts)
+
+
+def _paragraph_xml_text(p) -> str:
+    """
+    Return a <w:p> element's text the way python-docx's Paragraph.text does.
+
+    Only the paragraph's own runs and hyperlink runs count; runs nested
+    deeper (e.g. text boxes in mc:AlternateContent) are skipped.
+    """
+    parts = []
+    for child in p:
+        if child.tag == W_R:
+            parts.append(_run_xml_text(child))
+        elif child.tag == W_HYPERLINK:
+            parts.extend(_run_xml_text(run) for run in child.iterfind(W_R))
+    return ''.join(parts)
+
+
+def _is_toggled_on(rpr, tag: str) -> bool:
+    """Return whether a run property toggle such as <w:b/> is present and on."""
+    elem = rpr.find(tag)
+    return elem is not None and elem.get(W_VAL, "true").lower() not in _FALSE_VALUES
+
+
+def iter_table_rows(tbl) -> Iterator[List[str]]:
+    """
+    Yield the cell texts of each row of a <w:tbl> element.
+
+    python-docx resolves every ``row.cells`` access through the whole
+    table grid, which is quadratic on large tables. Walking the XML once
+    is linear. Merged cells are repeated the same way python-docx
+    reports them; paragraphs within a cell are joined with newlines.
+    """
+    above: List[str] = []
+    
+    for tr in tbl.iterfind(W_TR):
+        cells: List[str] = []
+        for tc in tr.iterfind(W_TC):
+            span_elem = tc.find(W_GRID_SPAN)
+            span = int(span_elem.get(W_VAL, 1)) if span_elem is not None else 1
+            
+            v_merge = tc.find(W_V_MERGE)
+            if v_merge is not None and v_merge.get(W_VAL) != 'restart' and above:
+                # Continuation of a vertical merge: reuse the cell above
+                col = len(cells)
+                cell_text = above[col] if col < len(above) else ''
+            else:
+                cell_text = '\n'.join(_paragraph_xml_text(p) for p in tc.iterfind(W_P))
+            
+            cells.extend([cell_text] * span)
+        
+        yield cells
+        above = cells
+
+
+def rows_to_markdown(rows: List[List[str]]) -> str:
+    """Format rows of cell text as a Markdown pipe table."""
+    if not rows:
+        return ""
+    
+    # Normalize column count, copying only rows that are short
+    max_cols = max(len(row) for row in rows)
+    if max_cols == 0:
+        return ""
+    lines = [
+        f"| {' | '.join(row if len(row) == max_cols else row + [''] * (max_cols - len(row)))} |"
+        for row in rows
+    ]
+    
+    # Separator after the header row
+    lines.insert(1, f"| {' | '.join(['---'] * max_cols)} |")
+    
+    return '\n'.join(lines)
+
+
+def table_xml_to_markdown(tbl) -> str:
+    """Convert a <w:tbl> element to a Markdown pipe table, escaping pipes."""
+    # Share one string object per distinct cell value (blanks, merged cells)
+    intern = {}.setdefault
+    rows = []
+    for cells in iter_table_rows(tbl):
+        row = []
+        for text in cells:
+            text = text.replace('\n', ' ').replace('|', '\\|').strip()
+            row.append(intern(text, text))
+        rows.append(row)
+    
+    return rows_to_markdown(rows)
+
 
 class BasicDocxConverter(BaseConverter):
     """
@@ -31,11 +171,25 @@ class BasicDocxConverter(BaseConverter):
         self,
         input_path: str,
         output_path: Optional[str] = None,
+        fast_tables: bool = True,
         **kwargs
     ):
-        """Initialize basic DOCX converter."""
+        """
+        Initialize basic DOCX converter.
+
+        Args:
+            input_path: Path to DOCX file
+            output_path: Optional output path for Markdown
+            fast_tables: Read table cells straight from the XML instead of
+                through python-docx Table/Cell objects (default: True)
+            **kwargs: Additional options passed to base converter
+        """
         super().__init__(input_path, output_path, **kwargs)
         
+        self.fast_tables = fast_tables
+        # Style display names by style ID, resolved once per document
+        self._style_names: Dict[Optional[str], str] = {}
+        
         if not PYTHON_DOCX_AVAILABLE:
             raise RuntimeError("python-docx not available. Install with: pip install python-docx")
 
@@ -47,25 +201,27 @@ class BasicDocxConverter(BaseConverter):
         
         # Create images directory
         if self.images_dir and self.extract_images:
-            self.images_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_images_dir()
         
         markdown_parts = []
         
         # Process document body
         for element in doc.element.body:
-            tag = element.tag.split('}')[-1]  # Remove namespace
+            tag = element.tag
             
-            if tag == 'p':
+            if tag == W_P:
                 # Paragraph
                 para = Paragraph(element, doc)
                 md = self._paragraph_to_markdown(para)
                 if md:
                     markdown_parts.append(md)
                     
-            elif tag == 'tbl':
+            elif tag == W_TBL:
                 # Table
-                table = Table(element, doc)
-                md = self._table_to_markdown(table)
+                if self.fast_tables:
+                    md = self._fast_table_to_markdown(element)
+                else:
+                    md = self._table_to_markdown(Table(element, doc))
                 if md:
                     markdown_parts.append(md)
         
@@ -88,14 +244,11 @@ class BasicDocxConverter(BaseConverter):
             return ""
         
         # Check for heading style
-        style_name = para.style.name if para.style else ""
+        style_name = self._style_name(para)
         
-        if style_name.startswith('Heading'):
-            try:
-                level = int(style_name.replace('Heading', '').strip())
-                return '#' * level + ' ' + text
-            except ValueError:
-                pass
+        level = _HEADING_LEVELS.get(style_name)
+        if level:
+            return '#' * level + ' ' + text
         
         if style_name == 'Title':
             return '# ' + text
@@ -109,20 +262,41 @@ class BasicDocxConverter(BaseConverter):
         
         return formatted
 
+    def _style_name(self, para: 'Paragraph') -> str:
+        """Return a paragraph's style name, looking each style ID up once."""
+        style_id = para._p.style
+        name = self._style_names.get(style_id)
+        if name is None:
+            style = para.style
+            name = self._style_names[style_id] = (style.name or "") if style else ""
+        return name
+
     def _apply_inline_formatting(self, para: 'Paragraph') -> str:
         """Apply bold/italic formatting to paragraph text."""
+        # Read runs straight from the XML rather than through python-docx Run objects
+        p = para._p
+        runs = p.findall(W_R)
+        
+        # Fast path: no run sets bold/italic directly, so the text is plain
+        if p.find(W_RUN_BOLD) is None and p.find(W_RUN_ITALIC) is None:
+            return ''.join(_run_xml_text(run) for run in runs)
+        
         parts = []
         
-        for run in para.runs:
-            text = run.text
+        for run in runs:
+            text = _run_xml_text(run)
             if not text:
                 continue
             
-            if run.bold and run.italic:
+            rpr = run.find(W_RPR)
+            bold = rpr is not None and _is_toggled_on(rpr, W_B)
+            italic = rpr is not None and _is_toggled_on(rpr, W_I)
+            
+            if bold and italic:
                 text = f"***{text}***"
-            elif run.bold:
+            elif bold:
                 text = f"**{text}**"
-            elif run.italic:
+            elif italic:
                 text = f"*{text}*"
             
             parts.append(text)
@@ -132,65 +306,57 @@ class BasicDocxConverter(BaseConverter):
     def _table_to_markdown(self, table: 'Table') -> str:
         """Convert table to Markdown."""
         rows = []
+        # Share one string object per distinct cell value (blanks, merged cells)
+        intern = {}.setdefault
         
         for row in table.rows:
             cells = []
             for cell in row.cells:
                 # Get cell text, handling merged cells
                 cell_text = cell.text.replace('\n', ' ').replace('|', '\\|').strip()
-                cells.append(cell_text)
+                cells.append(intern(cell_text, cell_text))
             rows.append(cells)
         
-        if not rows:
-            return ""
-        
-        # Normalize column count
-        max_cols = max(len(row) for row in rows)
-        normalized = [row + [''] * (max_cols - len(row)) for row in rows]
-        
-        lines = []
-        
-        # Header row
-        lines.append('| ' + ' | '.join(normalized[0]) + ' |')
-        
-        # Separator
-        lines.append('| ' + ' | '.join(['---'] * max_cols) + ' |')
-        
-        # Data rows
-        for row in normalized[1:]:
-            lines.append('| ' + ' | '.join(row) + ' |')
-        
-        return '\n'.join(lines)
+        return rows_to_markdown(rows)
+
+    def _fast_table_to_markdown(self, tbl) -> str:
+        """Convert a <w:tbl> element to Markdown without python-docx objects."""
+        return table_xml_to_markdown(tbl)
 
     def _extract_images(self, doc) -> None:
-        """Extract images from document."""
+        """
+        Extract images from document.
+
+        Names are assigned in relationship order; the files are then
+        written concurrently, as each write is independent.
+        """
         try:
-            for rel in doc.part.rels.values():
-                if "image" in rel.target_ref:
-                    try:
-                        image_data = rel.target_part.blob
-                        ext = rel.target_ref.split('.')[-1].lower()
-                        if ext == 'jpeg':
-                            ext = 'jpg'
-                        
-                        self._process_image(image_data, ext)
+            image_rels = [
+                rel for rel in doc.part.rels.values()
+                if not rel.is_external and "image" in rel.target_ref
+            ]
+            
+            writes = []
+            for rel in image_rels:
+                try:
+                    image_data = rel.target_part.blob
+                    ext = rel.target_ref.rsplit('.', 1)[-1].lower()
+                    if ext == 'jpeg':
+                        ext = 'jpg'
+                    
+                    _, image_path = self._reserve_image(image_data, ext)
+                    if image_path is not None:
+                        writes.append((image_path, image_data))
                         
-                    except Exception as e:
-                        logger.debug(f"Failed to extract image: {e}")
+                except Exception as e:
+                    logger.debug(f"Failed to extract image: {e}")
+            
+            _write_files(writes)
                         
         except Exception as e:
             logger.warning(f"Image extraction failed: {e}")
 
     def _cleanup_markdown(self, markdown: str) -> str:
         """Clean up generated Markdown."""
-        # Remove multiple blank lines
-        markdown = re.sub(r'\n{3,}', '\n\n', markdown)
-        
-        # Fix broken bold/italic
-        markdown = re.sub(r'\*{4,}', '**', markdown)
-        
-        # Clean trailing whitespace
-        lines = markdown.split('\n')
-        lines = [line.rstrip() for line in lines]
-        
-        return '\n'.join(lines).strip()
\ No newline at end of file
+        # Collapse blank lines, trim trailing whitespace, fix broken bold/italic
+        return self._tidy_lines(markdown, fix_emphasis=True).strip()
\ No newline at end of file
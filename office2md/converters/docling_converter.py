@@ -1,25 +1,164 @@
 """Docling-based converter for PDF files."""
 
-import base64
-import io
+import functools
+import importlib
+import importlib.util
 import logging
+import os
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterable, Set, Tuple, Union
 
-from office2md.converters.base_converter import BaseConverter
+from office2md.converters.base_converter import BaseConverter, _b64decode, _encode_pil_image
 
 logger = logging.getLogger(__name__)
 
+# Importing docling loads its ML stack, so only check it is installed
+# here and import DocumentConverter when the first one is created
 try:
-    from docling.document_converter import DocumentConverter
-    DOCLING_AVAILABLE = True
-except ImportError:
+    DOCLING_AVAILABLE = importlib.util.find_spec("docling") is not None
+except (ImportError, ValueError):
     DOCLING_AVAILABLE = False
 
+DocumentConverter: Any = None
+
 # Docling works best with PDFs - DOCX support is limited
 DOCLING_SUPPORTED_EXTENSIONS = ['.pdf']
 
+# Placeholders Docling leaves where a picture was found (always lowercase,
+# like the leftover pattern below); [[image]] comes first so it is
+# replaced whole rather than as [image] inside brackets
+_IMAGE_PLACEHOLDER_RE = re.compile(
+    r'\[\[image\]\]|<!--\s*image\s*-->|\[image\d*\]|\{image\d*\}|!\[\]\(\s*\)'
+)
+
+# Placeholders left over after image references have been filled in
+_LEFTOVER_PLACEHOLDER_RE = re.compile(r'!\[\]\(\s*\)|<!--\s*image\s*-->|\[image\d*\]|\{image\d*\}')
+
+# Prefix of a base64 image data URI; the payload is sliced off after it
+_DATA_URI_RE = re.compile(r'data:image/(\w+);base64,')
+
+# Sentinel for attributes that are absent, as opposed to set to None
+_MISSING = object()
+
+# Threads used to encode extracted images
+IMAGE_ENCODE_WORKERS = min(8, os.cpu_count() or 1)
+
+# (kind, value, extension): kind is 'pil', 'data' or 'base64'
+ImageSource = Tuple[str, Any, str]
+
+_document_converter_lock = threading.Lock()
+
+
+# Pipeline options for the first, text-layer-only pass over a PDF
+FAST_PIPELINE_OPTIONS = (("do_ocr", False),)
+
+# Below this many non-whitespace characters per page, a PDF is treated as
+# scanned and converted again with OCR
+MIN_TEXT_CHARS_PER_PAGE = 64
+
+# Pages per range when OCR runs on several processes
+OCR_PAGES_PER_CHUNK = 8
+
+# Upper bound on documents Docling processes concurrently in convert_many()
+MAX_DOC_BATCH_SIZE = 16
+
+
+# PDF backends by name: (module, class); None keeps Docling's default
+PDF_BACKENDS = {
+    "pypdfium2": ("docling.backend.pypdfium2_backend", "PyPdfiumDocumentBackend"),
+    "dlparse_v2": ("docling.backend.docling_parse_v2_backend", "DoclingParseV2DocumentBackend"),
+    "dlparse_v4": ("docling.backend.docling_parse_v4_backend", "DoclingParseV4DocumentBackend"),
+}
+
+DEFAULT_PDF_BACKEND = "pypdfium2"
+
+
+@functools.lru_cache(maxsize=4)
+def _create_document_converter(
+    pipeline_options: Tuple[Tuple[str, Any], ...] = (),
+    pdf_backend: Optional[str] = None,
+) -> Any:
+    """Create a Docling DocumentConverter; cached per frozen option set."""
+    global DocumentConverter
+    if DocumentConverter is None:
+        from docling.document_converter import DocumentConverter
+    
+    if not pipeline_options and pdf_backend is None:
+        return DocumentConverter()
+    
+    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.pipeline_options import PdfPipelineOptions
+    from docling.document_converter import PdfFormatOption
+    
+    format_kwargs = {"pipeline_options": PdfPipelineOptions(**dict(pipeline_options))}
+    if pdf_backend is not None:
+        module_name, class_name = PDF_BACKENDS[pdf_backend]
+        format_kwargs["backend"] = getattr(importlib.import_module(module_name), class_name)
+    
+    return DocumentConverter(format_options={InputFormat.PDF: PdfFormatOption(**format_kwargs)})
+
+
+def get_document_converter(
+    pipeline_options: Tuple[Tuple[str, Any], ...] = (),
+    pdf_backend: Optional[str] = None,
+) -> Any:
+    """
+    Return a shared Docling DocumentConverter for the given options.
+
+    Docling's cost is dominated by model initialization, so one instance
+    is reused for every PDF converted in this process.
+
+    Args:
+        pipeline_options: Hashable (name, value) pairs for Docling's
+            PdfPipelineOptions; empty for Docling's default pipeline
+        pdf_backend: Key of PDF_BACKENDS, or None for Docling's default
+    """
+    with _document_converter_lock:
+        return _create_document_converter(pipeline_options, pdf_backend)
+
+
+def _count_pdf_pages(input_path: str) -> int:
+    """Count the pages of a PDF with pypdfium2 (installed with Docling)."""
+    import pypdfium2
+    
+    pdf = pypdfium2.PdfDocument(input_path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def _convert_page_range(
+    input_path: str,
+    page_range: Tuple[int, int],
+    pdf_backend: Optional[str],
+    with_images: bool,
+) -> Tuple[str, List[Tuple[bytes, str]]]:
+    """
+    Convert a range of PDF pages with Docling's OCR pipeline.
+
+    Runs in a worker process. Images are returned encoded, in document
+    order, so the parent process can name and save them.
+
+    Returns:
+        Tuple of the pages' Markdown and their (bytes, extension) images.
+    """
+    converter = DoclingConverter(input_path, pdf_backend=pdf_backend, skip_images=not with_images)
+    doc = get_document_converter((), pdf_backend).convert(input_path, page_range=page_range).document
+    markdown = doc.export_to_markdown()
+    
+    images = []
+    if with_images and _IMAGE_PLACEHOLDER_RE.search(markdown):
+        for source in converter._collect_image_sources(doc):
+            encoded = converter._encode_image_source(source)
+            if encoded is not None:
+                images.append(encoded)
+    
+    return markdown, images
+
 
 class DoclingConverter(BaseConverter):
     """
@@ -38,11 +177,39 @@ class DoclingConverter(BaseConverter):
         self,
         input_path: str,
         output_path: Optional[str] = None,
+        force_ocr: bool = False,
+        pdf_backend: Optional[str] = DEFAULT_PDF_BACKEND,
+        ocr_parallelism: int = 1,
         **kwargs
     ):
-        """Initialize Docling converter."""
+        """
+        Initialize Docling converter.
+
+        Args:
+            input_path: Path to PDF file
+            output_path: Optional output path for Markdown
+            force_ocr: Always use Docling's full OCR pipeline. By default a
+                PDF is first converted from its text layer only, and again
+                with OCR if that yields too little text.
+            pdf_backend: PDF parsing backend, one of PDF_BACKENDS
+                (default: pypdfium2), or None for Docling's default
+            ocr_parallelism: Worker processes for OCR; above 1, PDFs that
+                need OCR are converted in page ranges of OCR_PAGES_PER_CHUNK
+                pages in parallel, each worker loading its own models
+            **kwargs: Additional options passed to base converter
+        """
         super().__init__(input_path, output_path, **kwargs)
         
+        self.force_ocr = force_ocr
+        
+        if pdf_backend is not None and pdf_backend not in PDF_BACKENDS:
+            raise ValueError(
+                f"Unknown PDF backend '{pdf_backend}'. "
+                f"Choose from: {', '.join(PDF_BACKENDS)}"
+            )
+        self.pdf_backend = pdf_backend
+        self.ocr_parallelism = ocr_parallelism
+        
         if not DOCLING_AVAILABLE:
             raise RuntimeError(
                 "Docling is not installed. Install with:\n"
@@ -52,7 +219,7 @@ class DoclingConverter(BaseConverter):
             )
         
         # Validate file type
-        file_ext = Path(input_path).suffix.lower()
+        file_ext = self.input_path.suffix.lower()
         if file_ext not in DOCLING_SUPPORTED_EXTENSIONS:
             raise ValueError(
                 f"Docling is optimized for PDF files only.\n"
@@ -64,185 +231,351 @@ class DoclingConverter(BaseConverter):
         
         self._image_counter = 0
         self._extracted_images: List[str] = []
+        self._extracted_image_refs: Set[str] = set()
 
     def convert(self) -> str:
         """Convert PDF to Markdown using Docling."""
         logger.info(f"Converting PDF with Docling: {self.input_path}")
         
         try:
-            # Initialize Docling converter
-            converter = DocumentConverter()
-            
-            # Convert document
-            result = converter.convert(str(self.input_path))
-            doc = result.document
-            
-            # Extract all images from the document
-            if self.extract_images and not self.skip_images:
-                self._extract_all_images(doc)
-            
-            # Export to Markdown
-            markdown = doc.export_to_markdown()
-            
-            logger.debug(f"Original markdown length: {len(markdown)} chars")
-            
-            # Replace image placeholders with actual references
-            if self._extracted_images:
-                markdown = self._replace_image_placeholders(markdown)
-            
-            # Clean up markdown
-            markdown = self._cleanup_docling_output(markdown)
-            
-            logger.info(f"Docling conversion completed ({len(markdown)} chars, {len(self._extracted_images)} images)")
-            return markdown
+            # Reuse the process-wide Docling converters (models load once);
+            # try the text layer first, OCR only documents that need it
+            if self.force_ocr:
+                if self.ocr_parallelism > 1:
+                    return self._convert_pages_in_parallel()
+                return self._document_to_markdown(self._convert_document())
+            return self._document_to_markdown(self._convert_document(FAST_PIPELINE_OPTIONS))
             
         except Exception as e:
             logger.error(f"Docling conversion failed: {e}")
             raise
 
+    @classmethod
+    def convert_many(
+        cls,
+        input_paths: Iterable[Union[str, Path]],
+        **kwargs
+    ) -> Dict[Path, str]:
+        """
+        Convert several PDFs through one Docling convert_all() call.
+
+        Docling batches page inference across the documents, which keeps
+        its models busier than converting one file at a time. Documents
+        that fail to convert are logged and left out of the result.
+
+        Args:
+            input_paths: PDF files to convert
+            **kwargs: Options passed to each DoclingConverter
+
+        Returns:
+            Dictionary mapping each converted input path to its Markdown.
+        """
+        converters = [cls(path, **kwargs) for path in input_paths]
+        if not converters:
+            return {}
+        
+        from docling.datamodel.base_models import ConversionStatus
+        from docling.datamodel.settings import settings
+        
+        first = converters[0]
+        pipeline_options = () if first.force_ocr else FAST_PIPELINE_OPTIONS
+        document_converter = get_document_converter(pipeline_options, first.pdf_backend)
+        
+        results: Dict[Path, str] = {}
+        previous_batch_size = settings.perf.doc_batch_size
+        settings.perf.doc_batch_size = min(MAX_DOC_BATCH_SIZE, len(converters))
+        try:
+            conversions = document_converter.convert_all(
+                [str(converter.input_path) for converter in converters],
+                raises_on_error=False,
+            )
+            # Results come back in input order
+            for converter, result in zip(converters, conversions):
+                if result.status not in (ConversionStatus.SUCCESS, ConversionStatus.PARTIAL_SUCCESS):
+                    logger.error(f"Docling conversion failed: {converter.input_path} ({result.status})")
+                    continue
+                try:
+                    results[converter.input_path] = converter._document_to_markdown(result.document)
+                except Exception as e:
+                    logger.error(f"Docling conversion failed: {converter.input_path}: {e}")
+        finally:
+            settings.perf.doc_batch_size = previous_batch_size
+        
+        return results
+
+    def _document_to_markdown(self, doc: Any, check_ocr: bool = True) -> str:
+        """
+        Turn a converted Docling document into cleaned-up Markdown.
+
+        A document from the text-layer-only pipeline is converted again
+        with OCR if it holds too little text.
+
+        Args:
+            doc: Converted Docling document
+            check_ocr: Whether to re-convert with OCR when text is sparse;
+                False for documents that already went through OCR
+        """
+        markdown = doc.export_to_markdown()
+        if check_ocr and not self.force_ocr and self._needs_ocr(doc, markdown):
+            logger.info("Little text found without OCR, converting again with OCR")
+            if self.ocr_parallelism > 1:
+                return self._convert_pages_in_parallel()
+            doc = self._convert_document()
+            markdown = doc.export_to_markdown()
+        
+        # Extract images only if the Markdown has somewhere to put them;
+        # Docling marks every picture with a placeholder
+        if self.extract_images and not self.skip_images and _IMAGE_PLACEHOLDER_RE.search(markdown):
+            self._extract_all_images(doc)
+        
+        logger.debug(f"Original markdown length: {len(markdown)} chars")
+        
+        # Replace image placeholders with actual references
+        if self._extracted_images:
+            markdown = self._replace_image_placeholders(markdown)
+        
+        # Clean up markdown
+        markdown = self._cleanup_docling_output(markdown)
+        
+        logger.info(f"Docling conversion completed ({len(markdown)} chars, {len(self._extracted_images)} images)")
+        return markdown
+
+    def _convert_pages_in_parallel(self) -> str:
+        """
+        OCR the PDF in page ranges on a process pool and join the Markdown.
+
+        Each range's image placeholders are filled with that range's own
+        images; the images are named and saved here, in page order.
+        """
+        page_count = _count_pdf_pages(str(self.input_path))
+        page_ranges = [
+            (start, min(start + OCR_PAGES_PER_CHUNK - 1, page_count))
+            for start in range(1, page_count + 1, OCR_PAGES_PER_CHUNK)
+        ]
+        if len(page_ranges) < 2:
+            return self._document_to_markdown(self._convert_document(), check_ocr=False)
+        
+        logger.info(
+            f"Converting {page_count} pages with OCR in {len(page_ranges)} ranges "
+            f"on {min(self.ocr_parallelism, len(page_ranges))} processes"
+        )
+        
+        chunks = []
+        with ProcessPoolExecutor(max_workers=min(self.ocr_parallelism, len(page_ranges))) as pool:
+            convert_range = functools.partial(
+                _convert_page_range,
+                str(self.input_path),
+                pdf_backend=self.pdf_backend,
+                with_images=self.extract_images and not self.skip_images,
+            )
+            for markdown, images in pool.map(convert_range, page_ranges):
+                refs = [ref for ref in map(self._store_encoded_image, images) if ref]
+                chunks.append(self._replace_image_placeholders(markdown, refs))
+        
+        markdown = self._cleanup_docling_output("\n\n".join(chunks))
+        
+        logger.info(f"Docling conversion completed ({len(markdown)} chars, {len(self._extracted_images)} images)")
+        return markdown
+
+    def _convert_document(self, pipeline_options: Tuple[Tuple[str, Any], ...] = ()) -> Any:
+        """Run a shared Docling converter over the input and return its document."""
+        converter = get_document_converter(pipeline_options, self.pdf_backend)
+        return converter.convert(str(self.input_path)).document
+
+    def _needs_ocr(self, doc: Any, markdown: str) -> bool:
+        """Check whether a text-layer conversion found too little text (scanned PDF)."""
+        page_count = len(getattr(doc, 'pages', None) or ()) or 1
+        text_chars = len(''.join(markdown.split()))
+        return text_chars < MIN_TEXT_CHARS_PER_PAGE * page_count
+
     def _extract_all_images(self, doc: Any) -> None:
-        """Extract all images from Docling document."""
+        """
+        Extract all images from Docling document.
+
+        Image sources are collected in document order, encoded on a
+        thread pool (PIL's PNG encoder releases the GIL), then saved and
+        recorded in order on the calling thread.
+        """
         if self.images_dir:
-            self.images_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_images_dir()
+        
+        sources = self._collect_image_sources(doc)
+        
+        if len(sources) > 1:
+            workers = min(IMAGE_ENCODE_WORKERS, len(sources))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                encoded_images = list(pool.map(self._encode_image_source, sources))
+        else:
+            encoded_images = [self._encode_image_source(source) for source in sources]
+        
+        for encoded in encoded_images:
+            self._store_encoded_image(encoded)
+        
+        logger.debug(f"Extracted {len(self._extracted_images)} images")
+
+    def _collect_image_sources(self, doc: Any) -> List[ImageSource]:
+        """List the image sources of a Docling document in document order."""
+        sources: List[ImageSource] = []
+        seen: Set[int] = set()
+        
+        def add(source: Optional[ImageSource]) -> None:
+            # A PIL image reached twice is encoded once (and not concurrently)
+            if source is None or id(source[1]) in seen:
+                return
+            seen.add(id(source[1]))
+            sources.append(source)
         
         # From document pictures
-        if hasattr(doc, 'pictures'):
-            for picture in (doc.pictures or []):
-                self._extract_picture(picture)
+        for picture in (getattr(doc, 'pictures', None) or []):
+            add(self._picture_source(picture))
         
         # From document pages
-        if hasattr(doc, 'pages'):
-            for page in (doc.pages or []):
-                if hasattr(page, 'image') and page.image:
-                    self._extract_image_object(page.image)
-                
-                if hasattr(page, 'pictures'):
-                    for picture in (page.pictures or []):
-                        self._extract_picture(picture)
+        for page in (getattr(doc, 'pages', None) or []):
+            page_image = getattr(page, 'image', None)
+            if page_image:
+                add(self._image_object_source(page_image))
+            
+            for picture in (getattr(page, 'pictures', None) or []):
+                add(self._picture_source(picture))
         
         # Iterate through all items
-        if hasattr(doc, 'iterate_items'):
+        iterate_items = getattr(doc, 'iterate_items', None)
+        if iterate_items is not None:
             try:
-                for item, level in doc.iterate_items():
-                    if hasattr(item, 'image') and item.image:
-                        self._extract_image_object(item.image)
-                    if hasattr(item, 'pil_image') and item.pil_image:
-                        self._save_pil_image(item.pil_image)
+                for item, level in iterate_items():
+                    item_image = getattr(item, 'image', None)
+                    if item_image:
+                        add(self._image_object_source(item_image))
+                    pil_image = getattr(item, 'pil_image', None)
+                    if pil_image:
+                        add(('pil', pil_image, 'png'))
             except Exception as e:
                 logger.debug(f"iterate_items failed: {e}")
         
-        logger.debug(f"Extracted {len(self._extracted_images)} images")
+        return sources
 
-    def _extract_picture(self, picture: Any) -> Optional[str]:
-        """Extract image from Docling picture object."""
+    def _picture_source(self, picture: Any) -> Optional[ImageSource]:
+        """Find the image source of a Docling picture object."""
         try:
-            if hasattr(picture, 'pil_image') and picture.pil_image:
-                return self._save_pil_image(picture.pil_image)
+            pil_image = getattr(picture, 'pil_image', None)
+            if pil_image:
+                return ('pil', pil_image, 'png')
             
-            if hasattr(picture, 'image'):
-                return self._extract_image_object(picture.image)
+            # An existing (even empty) image attribute takes precedence over data
+            image_obj = getattr(picture, 'image', _MISSING)
+            if image_obj is not _MISSING:
+                return self._image_object_source(image_obj)
             
-            if hasattr(picture, 'data') and picture.data:
-                ref = self._process_image(picture.data, 'png')
-                if ref:
-                    self._extracted_images.append(ref)
-                    return ref
+            data = getattr(picture, 'data', None)
+            if data:
+                return ('data', data, 'png')
                     
         except Exception as e:
             logger.debug(f"Failed to extract picture: {e}")
         
         return None
 
-    def _extract_image_object(self, image_obj: Any) -> Optional[str]:
-        """Extract image from image object."""
+    def _image_object_source(self, image_obj: Any) -> Optional[ImageSource]:
+        """Find the image source of a Docling image object."""
         try:
-            if hasattr(image_obj, 'pil_image') and image_obj.pil_image:
-                return self._save_pil_image(image_obj.pil_image)
+            pil_image = getattr(image_obj, 'pil_image', None)
+            if pil_image:
+                return ('pil', pil_image, 'png')
             
-            if hasattr(image_obj, 'data') and image_obj.data:
-                ref = self._process_image(image_obj.data, 'png')
-                if ref:
-                    self._extracted_images.append(ref)
-                    return ref
+            data = getattr(image_obj, 'data', None)
+            if data:
+                return ('data', data, 'png')
             
-            if hasattr(image_obj, 'uri') and image_obj.uri:
-                if image_obj.uri.startswith('data:'):
-                    match = re.match(r'data:image/(\w+);base64,(.+)', image_obj.uri)
-                    if match:
-                        ext = match.group(1)
-                        data = base64.b64decode(match.group(2))
-                        ref = self._process_image(data, ext)
-                        if ref:
-                            self._extracted_images.append(ref)
-                            return ref
+            uri = getattr(image_obj, 'uri', None)
+            if uri and uri.startswith('data:'):
+                match = _DATA_URI_RE.match(uri)
+                if match:
+                    return ('base64', uri[match.end():], match.group(1))
                             
         except Exception as e:
             logger.debug(f"Failed to extract image object: {e}")
         
         return None
 
-    def _save_pil_image(self, pil_image: Any) -> Optional[str]:
-        """Save PIL image and return markdown reference."""
+    def _encode_image_source(self, source: Optional[ImageSource]) -> Optional[Tuple[bytes, str]]:
+        """Turn an image source into file bytes and an extension; thread-safe."""
+        if source is None:
+            return None
+        
+        kind, value, ext = source
+        try:
+            if kind == 'pil':
+                return _encode_pil_image(value)
+            if kind == 'base64':
+                return _b64decode(value), ext
+            return value, ext
+        except Exception as e:
+            logger.debug(f"Failed to encode image: {e}")
+        
+        return None
+
+    def _store_encoded_image(self, encoded: Optional[Tuple[bytes, str]]) -> Optional[str]:
+        """Save encoded image bytes and record the reference."""
+        if encoded is None:
+            return None
         try:
-            img_buffer = io.BytesIO()
-            pil_image.save(img_buffer, format='PNG')
-            ref = self._process_image(img_buffer.getvalue(), 'png')
-            if ref:
-                self._extracted_images.append(ref)
-                return ref
+            return self._remember_image(self._process_image(*encoded))
         except Exception as e:
-            logger.debug(f"Failed to save PIL image: {e}")
+            logger.debug(f"Failed to save image: {e}")
         return None
 
-    def _replace_image_placeholders(self, markdown: str) -> str:
-        """Replace image placeholders with actual image references."""
-        if not self._extracted_images:
+    def _extract_picture(self, picture: Any) -> Optional[str]:
+        """Extract image from Docling picture object."""
+        return self._store_encoded_image(self._encode_image_source(self._picture_source(picture)))
+
+    def _extract_image_object(self, image_obj: Any) -> Optional[str]:
+        """Extract image from image object."""
+        return self._store_encoded_image(self._encode_image_source(self._image_object_source(image_obj)))
+
+    def _remember_image(self, ref: str) -> Optional[str]:
+        """
+        Record an extracted image reference, returning it.
+
+        The same picture is often reached through doc.pictures, the page
+        and iterate_items(); identical images share one saved file and
+        reference, which is recorded once.
+        """
+        if not ref:
+            return None
+        if ref not in self._extracted_image_refs:
+            self._extracted_image_refs.add(ref)
+            self._extracted_images.append(ref)
+        return ref
+
+    def _replace_image_placeholders(self, markdown: str, image_refs: Optional[List[str]] = None) -> str:
+        """
+        Replace image placeholders with actual image references.
+
+        Args:
+            markdown: Markdown exported by Docling
+            image_refs: References to fill in, in document order
+                (default: every image extracted so far)
+        """
+        if image_refs is None:
+            image_refs = self._extracted_images
+        if not image_refs:
             return markdown
         
-        ref_index = 0
+        refs = iter(image_refs)
         
-        patterns = [
-            r'<!--\s*image\s*-->',
-            r'\[image\d*\]',
-            r'\{image\d*\}',
-            r'!\[\]\(\s*\)',
-            r'\[\[image\]\]',
-        ]
-        
-        for pattern in patterns:
-            def make_replacer(idx_holder):
-                def replacer(match):
-                    if idx_holder[0] < len(self._extracted_images):
-                        ref = self._extracted_images[idx_holder[0]]
-                        idx_holder[0] += 1
-                        return ref
-                    return match.group(0)
-                return replacer
-            
-            idx_holder = [ref_index]
-            markdown = re.sub(pattern, make_replacer(idx_holder), markdown, flags=re.IGNORECASE)
-            ref_index = idx_holder[0]
+        # Fill placeholders in document order in a single pass
+        markdown = _IMAGE_PLACEHOLDER_RE.sub(
+            lambda match: next(refs, match.group(0)), markdown
+        )
         
         # Append unused images at the end
-        if ref_index < len(self._extracted_images):
-            remaining = self._extracted_images[ref_index:]
-            if remaining:
-                markdown += "\n\n"
-                for ref in remaining:
-                    markdown += f"\n{ref}\n"
+        remaining = list(refs)
+        if remaining:
+            markdown += "\n\n" + "".join(f"\n{ref}\n" for ref in remaining)
         
         return markdown
 
     def _cleanup_docling_output(self, markdown: str) -> str:
         """Clean up Docling markdown output."""
-        markdown = re.sub(r'!\[\]\(\s*\)', '', markdown)
-        markdown = re.sub(r'<!--\s*image\s*-->', '', markdown)
-        markdown = re.sub(r'\[image\d*\]', '', markdown)
-        markdown = re.sub(r'\{image\d*\}', '', markdown)
-        markdown = re.sub(r'\n{3,}', '\n\n', markdown)
-        
-        lines = markdown.split('\n')
-        lines = [line.rstrip() for line in lines]
-        markdown = '\n'.join(lines)
-        
-        return markdown
\ No newline at end of file
+        markdown = _LEFTOVER_PLACEHOLDER_RE.sub('', markdown)
+        return self._tidy_lines(markdown)
\ No newline at end of file
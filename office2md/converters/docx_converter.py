@@ -7,8 +7,11 @@ Converter Priority:
 3. python-docx (basic, always available)
 """
 
+import functools
+import importlib.util
 import logging
 import shutil
+import zipfile
 from pathlib import Path
 from typing import Optional
 
@@ -16,20 +19,21 @@ from office2md.converters.base_converter import BaseConverter
 
 logger = logging.getLogger(__name__)
 
-# Check availability of converters
-PANDOC_AVAILABLE = shutil.which('pandoc') is not None
+# Check availability of converters without importing them; each backend
+# module imports its own library when it is used
+MAMMOTH_AVAILABLE = importlib.util.find_spec("mammoth") is not None
+PYTHON_DOCX_AVAILABLE = importlib.util.find_spec("docx") is not None
+LXML_AVAILABLE = importlib.util.find_spec("lxml") is not None
 
-try:
-    import mammoth
-    MAMMOTH_AVAILABLE = True
-except ImportError:
-    MAMMOTH_AVAILABLE = False
+# Uncompressed size of word/document.xml above which basic extraction
+# with skipped images streams the part instead of parsing it whole
+STREAMING_DOCUMENT_SIZE = 32 * 1024 * 1024
 
-try:
-    import docx
-    PYTHON_DOCX_AVAILABLE = True
-except ImportError:
-    PYTHON_DOCX_AVAILABLE = False
+
+@functools.lru_cache(maxsize=None)
+def _pandoc_available() -> bool:
+    """Check for the Pandoc binary on PATH, once per process."""
+    return shutil.which('pandoc') is not None
 
 
 class DocxConverter(BaseConverter):
@@ -44,7 +48,9 @@ class DocxConverter(BaseConverter):
     Use flags to force a specific converter:
     - `use_pandoc=True`: Force Pandoc (error if unavailable)
     - `use_mammoth=True`: Force Mammoth, skip Pandoc
-    - `use_basic=True`: Force python-docx only (skip Pandoc and Mammoth)
+    - `use_basic=True`: Force basic extraction (skip Pandoc and Mammoth);
+      reads the package XML directly, falling back to python-docx.
+      Large documents converted with skip_images are streamed instead.
     """
 
     def __init__(
@@ -54,6 +60,7 @@ class DocxConverter(BaseConverter):
         use_pandoc: bool = False,
         use_mammoth: bool = False,
         use_basic: bool = False,
+        pandoc_server_url: Optional[str] = None,
         **kwargs
     ):
         """
@@ -64,7 +71,8 @@ class DocxConverter(BaseConverter):
             output_path: Optional output path for Markdown
             use_pandoc: Force Pandoc converter
             use_mammoth: Force Mammoth converter (skip Pandoc)
-            use_basic: Force python-docx only (skip Pandoc and Mammoth)
+            use_basic: Force basic extraction (skip Pandoc and Mammoth)
+            pandoc_server_url: URL of a running ``pandoc server`` to convert with
             **kwargs: Additional options passed to base converter
         """
         super().__init__(input_path, output_path, **kwargs)
@@ -72,9 +80,12 @@ class DocxConverter(BaseConverter):
         self.use_pandoc = use_pandoc
         self.use_mammoth = use_mammoth
         self.use_basic = use_basic
+        self.pandoc_server_url = pandoc_server_url
         
         # Store converter used for logging
         self._converter_used = None
+        # Conversion method picked by _select_converter(), resolved once
+        self._converter_func = None
 
     def convert(self) -> str:
         """
@@ -92,11 +103,46 @@ class DocxConverter(BaseConverter):
         logger.info(f"Conversion completed using: {self._converter_used}")
         return result
 
+    async def convert_async(self) -> str:
+        """
+        Convert DOCX to Markdown from within an event loop.
+
+        Pandoc runs as an asyncio subprocess; the pure-Python converters
+        run in the loop's default executor.
+        
+        Returns:
+            Markdown formatted string
+        """
+        import asyncio
+        
+        converter_func = self._select_converter()
+        
+        if self._converter_used == "pandoc":
+            result = await self._create_pandoc_converter().convert_async()
+        else:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(None, converter_func)
+        
+        logger.info(f"Conversion completed using: {self._converter_used}")
+        return result
+
     def _select_converter(self):
+        """Select the best available converter, resolving the choice once per instance."""
+        if self._converter_func is None:
+            self._converter_func = self._resolve_converter()
+        return self._converter_func
+
+    def _resolve_converter(self):
         """Select the best available converter based on flags and availability."""
         
-        # Force basic (python-docx only)
+        # Force basic (direct XML extraction, python-docx as fallback)
         if self.use_basic:
+            if self.skip_images and self._document_part_size() > STREAMING_DOCUMENT_SIZE:
+                self._converter_used = "streaming-docx"
+                return self._convert_with_streaming_docx
+            if LXML_AVAILABLE:
+                self._converter_used = "fast-docx"
+                return self._convert_with_fast_docx
             if not PYTHON_DOCX_AVAILABLE:
                 raise RuntimeError("python-docx not available. Install with: pip install python-docx")
             self._converter_used = "python-docx"
@@ -111,7 +157,7 @@ class DocxConverter(BaseConverter):
         
         # Force Pandoc
         if self.use_pandoc:
-            if not PANDOC_AVAILABLE:
+            if not _pandoc_available():
                 raise RuntimeError(
                     "Pandoc not available. Install with:\n"
                     "  macOS: brew install pandoc\n"
@@ -122,7 +168,7 @@ class DocxConverter(BaseConverter):
             return self._convert_with_pandoc
         
         # Auto-select: try in order of quality
-        if PANDOC_AVAILABLE:
+        if _pandoc_available():
             self._converter_used = "pandoc"
             return self._convert_with_pandoc
         
@@ -145,16 +191,20 @@ class DocxConverter(BaseConverter):
 
     def _convert_with_pandoc(self) -> str:
         """Convert using Pandoc (best quality)."""
+        return self._create_pandoc_converter().convert()
+
+    def _create_pandoc_converter(self):
+        """Create a PandocConverter sharing this converter's options."""
         from office2md.converters.pandoc_converter import PandocConverter
         
-        converter = PandocConverter(
+        return PandocConverter(
             str(self.input_path),
             str(self.output_path) if self.output_path else None,
+            server_url=self.pandoc_server_url,
             extract_images=self.extract_images,
             skip_images=self.skip_images,
             images_dir=self.images_dir,
         )
-        return converter.convert()
 
     def _convert_with_mammoth(self) -> str:
         """Convert using Mammoth (good quality)."""
@@ -182,6 +232,40 @@ class DocxConverter(BaseConverter):
         )
         return converter.convert()
 
+    def _convert_with_fast_docx(self) -> str:
+        """Convert by reading the package XML directly (basic, low overhead)."""
+        from office2md.converters.fast_docx_converter import FastDocxConverter
+        
+        converter = FastDocxConverter(
+            str(self.input_path),
+            str(self.output_path) if self.output_path else None,
+            extract_images=self.extract_images,
+            skip_images=self.skip_images,
+            images_dir=self.images_dir,
+        )
+        return converter.convert()
+
+    def _convert_with_streaming_docx(self) -> str:
+        """Convert by streaming the document part (basic, bounded memory)."""
+        from office2md.converters.streaming_docx_converter import StreamingDocxConverter
+        
+        converter = StreamingDocxConverter(
+            str(self.input_path),
+            str(self.output_path) if self.output_path else None,
+            extract_images=self.extract_images,
+            skip_images=self.skip_images,
+            images_dir=self.images_dir,
+        )
+        return converter.convert()
+
+    def _document_part_size(self) -> int:
+        """Return the uncompressed size of word/document.xml, or 0 if unreadable."""
+        try:
+            with zipfile.ZipFile(self.input_path) as package:
+                return package.getinfo("word/document.xml").file_size
+        except (OSError, KeyError, zipfile.BadZipFile):
+            return 0
+
     @property
     def converter_used(self) -> Optional[str]:
         """Return the name of the converter that was used."""
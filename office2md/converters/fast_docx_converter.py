@@ -0,0 +1,109 @@
+"""Fast basic DOCX converter reading package parts directly with lxml."""
+
+import logging
+import posixpath
+import zipfile
+from typing import Optional
+
+from office2md.converters.basic_docx_converter import W_BODY, W_P, W_TBL
+from office2md.converters.streaming_docx_converter import StreamingDocxConverter
+
+logger = logging.getLogger(__name__)
+
+try:
+    from lxml import etree
+    # Never expand entities from package parts, as python-docx's parser
+    _XML_PARSER = etree.XMLParser(resolve_entities=False)
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Package relationships namespace and image relationship type suffix
+RELS_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+IMAGE_REL_SUFFIX = "/image"
+
+
+class FastDocxConverter(StreamingDocxConverter):
+    """
+    Basic DOCX converter that never builds a python-docx object graph.
+
+    Reads only ``word/document.xml``, ``word/styles.xml`` and
+    ``word/_rels/document.xml.rels`` from the package and parses the
+    document once with lxml. Paragraph and table text (merged cells,
+    breaks) matches the basic python-docx converter, and images are
+    extracted from the document part's relationships.
+    """
+
+    def __init__(
+        self,
+        input_path: str,
+        output_path: Optional[str] = None,
+        **kwargs
+    ):
+        """Initialize fast DOCX converter."""
+        super().__init__(input_path, output_path, **kwargs)
+
+        if not LXML_AVAILABLE:
+            raise RuntimeError("lxml not available. Install with: pip install lxml")
+
+    def convert(self) -> str:
+        """Convert DOCX to Markdown from the raw document part."""
+        logger.info(f"Converting with fast DOCX parser: {self.input_path}")
+
+        with self._open_package() as package:
+            self._style_names = self._load_style_names(package)
+
+            root = etree.fromstring(package.read("word/document.xml"), _XML_PARSER)
+            body = root.find(W_BODY)
+
+            markdown_parts = []
+            for element in (body if body is not None else []):
+                if element.tag == W_P:
+                    md = self._paragraph_to_markdown(element)
+                elif element.tag == W_TBL:
+                    md = self._table_to_markdown(element)
+                else:
+                    continue
+                if md:
+                    markdown_parts.append(md)
+
+            # Extract images from document
+            if self.extract_images and not self.skip_images:
+                self._extract_images(package)
+
+        markdown = '\n\n'.join(markdown_parts)
+        markdown = self._cleanup_markdown(markdown)
+
+        logger.info("Fast DOCX conversion completed")
+        return markdown
+
+    def _extract_images(self, package: zipfile.ZipFile) -> None:
+        """Extract images referenced by the document part's relationships."""
+        try:
+            rels = etree.fromstring(package.read("word/_rels/document.xml.rels"), _XML_PARSER)
+        except KeyError:
+            return
+
+        for rel in rels.iterfind(f"{RELS_NS}Relationship"):
+            if not rel.get("Type", "").endswith(IMAGE_REL_SUFFIX):
+                continue
+            if rel.get("TargetMode") == "External":
+                continue
+
+            target = rel.get("Target", "")
+            try:
+                # Targets are relative to word/ unless absolute within the package
+                if target.startswith("/"):
+                    member = target.lstrip("/")
+                else:
+                    member = posixpath.normpath(posixpath.join("word", target))
+
+                ext = target.rsplit('.', 1)[-1].lower()
+                if ext == 'jpeg':
+                    ext = 'jpg'
+
+                with package.open(member) as stream:
+                    self._process_image_stream(stream, ext)
+
+            except Exception as e:
+                logger.debug(f"Failed to extract image: {e}")
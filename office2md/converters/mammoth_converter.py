@@ -1,12 +1,14 @@
 """Mammoth-based DOCX converter with enhanced table and image support."""
 
+import html as html_lib
 import logging
 import re
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Set, Tuple
 from io import BytesIO
 
-from office2md.converters.base_converter import BaseConverter
+from office2md.converters.base_converter import BaseConverter, _write_files
+from office2md.converters.basic_docx_converter import iter_table_rows, rows_to_markdown
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,42 @@ try:
 except ImportError:
     PYTHON_DOCX_AVAILABLE = False
 
+# Link target of a Markdown image reference
+_REF_TARGET_RE = re.compile(r'\(([^)]+)\)')
+
+# An <img> tag in Mammoth's HTML, capturing its src attribute
+_IMG_TAG_RE = re.compile(r'<img[^>]*src="([^"]*)"[^>]*>')
+
+# A block of consecutive pipe-table lines
+_PIPE_TABLE_RE = re.compile(r'\|[^\n]+\|(?:\n\|[^\n]+\|)*')
+
+# HTML -> Markdown rewrites for the fallback converter, applied in order
+_BASIC_HTML_RULES = [
+    # Headers
+    (re.compile(r'<h1[^>]*>(.*?)</h1>', re.DOTALL), r'# \1\n'),
+    (re.compile(r'<h2[^>]*>(.*?)</h2>', re.DOTALL), r'## \1\n'),
+    (re.compile(r'<h3[^>]*>(.*?)</h3>', re.DOTALL), r'### \1\n'),
+    (re.compile(r'<h4[^>]*>(.*?)</h4>', re.DOTALL), r'#### \1\n'),
+    # Bold and italic
+    (re.compile(r'<strong[^>]*>(.*?)</strong>', re.DOTALL), r'**\1**'),
+    (re.compile(r'<b[^>]*>(.*?)</b>', re.DOTALL), r'**\1**'),
+    (re.compile(r'<em[^>]*>(.*?)</em>', re.DOTALL), r'*\1*'),
+    (re.compile(r'<i[^>]*>(.*?)</i>', re.DOTALL), r'*\1*'),
+    # Lists
+    (re.compile(r'<li[^>]*>(.*?)</li>', re.DOTALL), r'- \1\n'),
+    (re.compile(r'<[uo]l[^>]*>'), ''),
+    (re.compile(r'</[uo]l>'), '\n'),
+    # Paragraphs and breaks
+    (re.compile(r'<p[^>]*>(.*?)</p>', re.DOTALL), r'\1\n\n'),
+    (re.compile(r'<br\s*/?>'), '\n'),
+    # Images
+    (re.compile(r'<img[^>]*src="([^"]*)"[^>]*/?\s*>'), r'![](\1)'),
+    # Links
+    (re.compile(r'<a[^>]*href="([^"]*)"[^>]*>(.*?)</a>', re.DOTALL), r'[\2](\1)'),
+    # Remove remaining tags
+    (re.compile(r'<[^>]+>'), ''),
+]
+
 
 class MammothConverter(BaseConverter):
     """
@@ -46,6 +84,11 @@ class MammothConverter(BaseConverter):
         """Initialize Mammoth converter."""
         super().__init__(input_path, output_path, **kwargs)
         
+        # Images named during HTML conversion, written once it finishes,
+        # and the src each one was given in the HTML
+        self._pending_image_writes: List[Tuple[str, bytes]] = []
+        self._pending_image_srcs: Dict[str, str] = {}
+        
         if not MAMMOTH_AVAILABLE:
             raise RuntimeError("Mammoth not available. Install with: pip install mammoth")
 
@@ -55,7 +98,7 @@ class MammothConverter(BaseConverter):
         
         # Create images directory
         if self.images_dir and self.extract_images:
-            self.images_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_images_dir()
         
         # Convert with Mammoth
         with open(self.input_path, "rb") as docx_file:
@@ -66,6 +109,14 @@ class MammothConverter(BaseConverter):
         
         html = result.value
         
+        # Write the images Mammoth handed over, concurrently, and drop
+        # the references to any that could not be written
+        failed = _write_files(self._pending_image_writes)
+        if failed:
+            html = self._drop_images(html, {self._pending_image_srcs[path] for path in failed})
+        self._pending_image_writes = []
+        self._pending_image_srcs = {}
+        
         # Log any warnings
         for message in result.messages:
             logger.warning(f"Mammoth: {message}")
@@ -87,8 +138,13 @@ class MammothConverter(BaseConverter):
         return markdown
 
     def _handle_image(self, image) -> Dict[str, Any]:
-        """Handle image extraction from Mammoth."""
-        if self.skip_images:
+        """
+        Handle image extraction from Mammoth.
+
+        The image is named here, in document order, but its file is only
+        queued; convert() writes all queued images together.
+        """
+        if self.skip_images or not self.extract_images:
             return {}
         
         try:
@@ -99,18 +155,27 @@ class MammothConverter(BaseConverter):
             if ext == 'jpeg':
                 ext = 'jpg'
             
-            ref = self._process_image(image_data, ext)
-            if ref:
-                # Extract path from markdown reference
-                match = re.search(r'\(([^)]+)\)', ref)
-                if match:
-                    return {"src": match.group(1)}
+            ref, image_path = self._reserve_image(image_data, ext)
+            # Extract path from markdown reference
+            match = _REF_TARGET_RE.search(ref)
+            if match:
+                if image_path is not None:
+                    self._pending_image_writes.append((image_path, image_data))
+                    self._pending_image_srcs[image_path] = match.group(1)
+                return {"src": match.group(1)}
             
         except Exception as e:
             logger.warning(f"Failed to process image: {e}")
         
         return {}
 
+    def _drop_images(self, html: str, srcs: Set[str]) -> str:
+        """Remove <img> tags whose src is one of ``srcs`` from the HTML."""
+        def replace(match):
+            return '' if html_lib.unescape(match.group(1)) in srcs else match.group(0)
+        
+        return _IMG_TAG_RE.sub(replace, html)
+
     def _enhance_tables(self, markdown: str) -> str:
         """Enhance tables using python-docx for better extraction."""
         try:
@@ -130,7 +195,7 @@ class MammothConverter(BaseConverter):
             # This is a heuristic - Mammoth tables may be incomplete
             if table_markdowns:
                 # Check if markdown has incomplete tables
-                existing_tables = re.findall(r'\|[^\n]+\|(?:\n\|[^\n]+\|)*', markdown)
+                existing_tables = _PIPE_TABLE_RE.findall(markdown)
                 
                 if len(existing_tables) < len(table_markdowns):
                     # Append missing tables
@@ -144,58 +209,18 @@ class MammothConverter(BaseConverter):
 
     def _table_to_markdown(self, table) -> str:
         """Convert python-docx table to Markdown."""
-        rows = []
-        for row in table.rows:
-            cells = [cell.text.replace('\n', ' ').strip() for cell in row.cells]
-            rows.append(cells)
-        
-        if not rows:
-            return ""
-        
-        # Normalize column count
-        max_cols = max(len(row) for row in rows)
-        normalized = [row + [''] * (max_cols - len(row)) for row in rows]
+        # Walk the table XML directly; row.cells is quadratic on large tables
+        rows = [
+            [text.replace('\n', ' ').strip() for text in cells]
+            for cells in iter_table_rows(table._tbl)
+        ]
         
-        lines = []
-        lines.append('| ' + ' | '.join(normalized[0]) + ' |')
-        lines.append('| ' + ' | '.join(['---'] * max_cols) + ' |')
-        
-        for row in normalized[1:]:
-            lines.append('| ' + ' | '.join(row) + ' |')
-        
-        return '\n'.join(lines)
+        return rows_to_markdown(rows)
 
     def _basic_html_to_markdown(self, html: str) -> str:
         """Basic HTML to Markdown conversion when markdownify is not available."""
-        # Headers
-        html = re.sub(r'<h1[^>]*>(.*?)</h1>', r'# \1\n', html, flags=re.DOTALL)
-        html = re.sub(r'<h2[^>]*>(.*?)</h2>', r'## \1\n', html, flags=re.DOTALL)
-        html = re.sub(r'<h3[^>]*>(.*?)</h3>', r'### \1\n', html, flags=re.DOTALL)
-        html = re.sub(r'<h4[^>]*>(.*?)</h4>', r'#### \1\n', html, flags=re.DOTALL)
-        
-        # Bold and italic
-        html = re.sub(r'<strong[^>]*>(.*?)</strong>', r'**\1**', html, flags=re.DOTALL)
-        html = re.sub(r'<b[^>]*>(.*?)</b>', r'**\1**', html, flags=re.DOTALL)
-        html = re.sub(r'<em[^>]*>(.*?)</em>', r'*\1*', html, flags=re.DOTALL)
-        html = re.sub(r'<i[^>]*>(.*?)</i>', r'*\1*', html, flags=re.DOTALL)
-        
-        # Lists
-        html = re.sub(r'<li[^>]*>(.*?)</li>', r'- \1\n', html, flags=re.DOTALL)
-        html = re.sub(r'<[uo]l[^>]*>', '', html)
-        html = re.sub(r'</[uo]l>', '\n', html)
-        
-        # Paragraphs and breaks
-        html = re.sub(r'<p[^>]*>(.*?)</p>', r'\1\n\n', html, flags=re.DOTALL)
-        html = re.sub(r'<br\s*/?>', '\n', html)
-        
-        # Images
-        html = re.sub(r'<img[^>]*src="([^"]*)"[^>]*/?\s*>', r'![](\1)', html)
-        
-        # Links
-        html = re.sub(r'<a[^>]*href="([^"]*)"[^>]*>(.*?)</a>', r'[\2](\1)', html, flags=re.DOTALL)
-        
-        # Remove remaining tags
-        html = re.sub(r'<[^>]+>', '', html)
+        for pattern, replacement in _BASIC_HTML_RULES:
+            html = pattern.sub(replacement, html)
         
         # Clean up entities
         html = html.replace('&nbsp;', ' ')
@@ -207,12 +232,5 @@ class MammothConverter(BaseConverter):
 
     def _cleanup_markdown(self, markdown: str) -> str:
         """Clean up the generated Markdown."""
-        # Remove multiple blank lines
-        markdown = re.sub(r'\n{3,}', '\n\n', markdown)
-        
-        # Clean up trailing whitespace
-        lines = markdown.split('\n')
-        lines = [line.rstrip() for line in lines]
-        markdown = '\n'.join(lines)
-        
-        return markdown.strip()
\ No newline at end of file
+        # Collapse blank lines and trim trailing whitespace
+        return self._tidy_lines(markdown).strip()
\ No newline at end of file
@@ -1,15 +1,21 @@
 """Pandoc-based converter for DOCX files."""
 
+import base64
+import json
 import logging
 import re
 import shutil
+import socket
 import subprocess
 import tempfile
+import time
+import urllib.error
+import urllib.request
 from pathlib import Path
 from typing import Dict, List, Optional
 from html.parser import HTMLParser
 
-from office2md.converters.base_converter import BaseConverter
+from office2md.converters.base_converter import IMAGE_COPY_BUFFER_SIZE, BaseConverter, _IMG_STRIP_RE
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +27,130 @@ def is_pandoc_available() -> bool:
 
 PANDOC_AVAILABLE = is_pandoc_available()
 
+# Seconds to wait for a single Pandoc invocation
+PANDOC_TIMEOUT = 120
+
+# Markdown flavour requested from Pandoc - force pipe tables
+PANDOC_MARKDOWN_FORMAT = 'markdown+pipe_tables-simple_tables-multiline_tables-grid_tables'
+
+# Markdown image reference: alt text and target
+_MD_IMAGE_RE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Pandoc attribute blocks: image dimensions, styles, ids and classes
+_PANDOC_ATTRIBUTES_RE = re.compile(
+    r'\{width="[^"]*"(?:\s*height="[^"]*")?\}|\{height="[^"]*"\}|\{style="[^"]*"\}|\{[#.][^}]*\}'
+)
+
+# <img> tags still pointing into a temporary media directory
+_TEMP_IMG_TAG_RE = re.compile(r'<img[^>]*src="[^"]*(?:tmp|var/folders)[^"]*"[^>]*/?\s*>')
+
+_EMPTY_PARAGRAPH_RE = re.compile(r'<p>\s*</p>')
+
+# A complete HTML table
+_HTML_TABLE_RE = re.compile(r'<table[^>]*>.*?</table>', re.DOTALL | re.IGNORECASE)
+
+# Table structure tags left outside converted tables
+_ORPHAN_TABLE_TAG_RE = re.compile(r'</?colgroup[^>]*>|<col[^>]*/?\s*>|</?thead[^>]*>|</?tbody[^>]*>')
+
+_ESCAPED_PUNCTUATION_RE = re.compile(r'\\([.,:;!?])')
+
+
+class PandocServer:
+    """
+    A long-lived ``pandoc server`` process shared by many conversions.
+
+    Starting Pandoc costs tens of milliseconds per process, which dominates
+    batches of small documents. The server converts documents posted to
+    its HTTP API, so one process serves every file (and every worker) in
+    a batch.
+
+    Usage:
+        with PandocServer() as server:
+            PandocConverter(path, server_url=server.url).convert()
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, startup_timeout: float = 10.0):
+        """
+        Initialize the server wrapper.
+
+        Args:
+            host: Interface to bind
+            port: Port to listen on (0 picks a free port)
+            startup_timeout: Seconds to wait for the server to accept connections
+        """
+        self.host = host
+        self.port = port
+        self.startup_timeout = startup_timeout
+        self._process: Optional[subprocess.Popen] = None
+        self._stderr = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self) -> str:
+        """Start the server and wait until it accepts connections."""
+        if not PANDOC_AVAILABLE:
+            raise RuntimeError("Pandoc is not installed")
+        
+        if not self.port:
+            with socket.socket() as sock:
+                sock.bind((self.host, 0))
+                self.port = sock.getsockname()[1]
+        
+        # A file rather than a pipe: nothing reads stderr while a batch runs,
+        # and a full pipe would block a server that keeps logging
+        self._stderr = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(
+            ['pandoc', 'server', '--port', str(self.port), '--timeout', str(PANDOC_TIMEOUT)],
+            stdout=subprocess.DEVNULL,
+            stderr=self._stderr,
+        )
+        
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                self._stderr.seek(0)
+                stderr = self._stderr.read().decode('utf-8', errors='replace')
+                self._process = None
+                self._stderr.close()
+                self._stderr = None
+                raise RuntimeError(f"Pandoc server exited: {stderr}")
+            try:
+                with socket.create_connection((self.host, self.port), timeout=0.2):
+                    logger.debug(f"Pandoc server listening on {self.url}")
+                    return self.url
+            except OSError:
+                time.sleep(0.05)
+        
+        self.stop()
+        raise RuntimeError("Pandoc server did not start in time")
+
+    def stop(self) -> None:
+        """Stop the server process."""
+        if self._process is None:
+            return
+        
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._stderr.close()
+        self._process = None
+        self._stderr = None
+
+    def __enter__(self) -> "PandocServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
 
 class HTMLTableParser(HTMLParser):
     """Parser to extract table data from HTML."""
@@ -84,17 +214,23 @@ class PandocConverter(BaseConverter):
     with excellent support for tables, headings, lists, and images.
     
     Requires: `brew install pandoc` (macOS) or equivalent.
+    
+    Pass ``server_url`` (see `PandocServer`) to convert through a running
+    ``pandoc server`` instead of starting a Pandoc process per file.
     """
 
     def __init__(
         self,
         input_path: str,
         output_path: Optional[str] = None,
+        server_url: Optional[str] = None,
         **kwargs
     ):
         """Initialize Pandoc converter."""
         super().__init__(input_path, output_path, **kwargs)
         
+        self.server_url = server_url
+        
         if not PANDOC_AVAILABLE:
             raise RuntimeError(
                 "Pandoc is not installed. Install with:\n"
@@ -107,64 +243,166 @@ class PandocConverter(BaseConverter):
         """Convert DOCX to Markdown using Pandoc."""
         logger.info(f"Converting with Pandoc: {self.input_path}")
         
+        if self.server_url:
+            return self._convert_with_server()
+        
         try:
             with tempfile.TemporaryDirectory() as tmpdir:
-                media_dir = Path(tmpdir) / "media"
-                
-                # Build Pandoc command - force pipe tables
-                cmd = [
-                    'pandoc',
-                    str(self.input_path),
-                    '-f', 'docx',
-                    '-t', 'markdown+pipe_tables-simple_tables-multiline_tables-grid_tables',
-                    '--wrap=none',
-                    '--markdown-headings=atx',
-                    f'--extract-media={tmpdir}',
-                ]
-                
                 # Run Pandoc
                 result = subprocess.run(
-                    cmd,
+                    self._build_command(tmpdir),
                     capture_output=True,
                     text=True,
-                    timeout=120
+                    timeout=PANDOC_TIMEOUT
                 )
                 
                 if result.returncode != 0:
                     raise RuntimeError(f"Pandoc error: {result.stderr}")
                 
-                markdown = result.stdout
+                return self._process_output(result.stdout, Path(tmpdir) / "media")
                 
-                # Extract images and build path mapping
-                path_mapping = {}
-                if self.extract_images and media_dir.exists():
-                    path_mapping = self._extract_and_map_images(media_dir)
-                
-                # Replace image paths BEFORE converting HTML tables
-                if path_mapping:
-                    markdown = self._replace_image_paths(markdown, path_mapping)
-                elif self.skip_images:
-                    markdown = re.sub(r'!\[.*?\]\(.*?\)', '', markdown)
-                
-                # Convert any HTML tables to Markdown pipe tables
-                markdown = self._convert_html_tables_to_markdown(markdown)
+        except subprocess.TimeoutExpired:
+            raise RuntimeError("Pandoc conversion timed out")
+        except Exception as e:
+            logger.error(f"Pandoc conversion failed: {e}")
+            raise
+
+    async def convert_async(self) -> str:
+        """
+        Convert DOCX to Markdown without blocking the event loop.
+
+        Runs Pandoc via asyncio subprocesses so many conversions can be
+        in flight at once from a single Python process.
+        """
+        import asyncio
+        
+        logger.info(f"Converting with Pandoc (async): {self.input_path}")
+        
+        if self.server_url:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._convert_with_server)
+        
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                process = await asyncio.create_subprocess_exec(
+                    *self._build_command(tmpdir),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
                 
-                # Clean up Pandoc-specific artifacts
-                markdown = self._cleanup_pandoc_output(markdown)
+                try:
+                    stdout, stderr = await asyncio.wait_for(
+                        process.communicate(), timeout=PANDOC_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    raise RuntimeError("Pandoc conversion timed out")
                 
-                # Final pass: update any remaining temp image paths
-                if path_mapping:
-                    markdown = self._replace_image_paths(markdown, path_mapping)
+                if process.returncode != 0:
+                    raise RuntimeError(
+                        f"Pandoc error: {stderr.decode('utf-8', errors='replace')}"
+                    )
                 
-                logger.info("Pandoc conversion completed successfully")
-                return markdown
+                return self._process_output(
+                    stdout.decode('utf-8', errors='replace'), Path(tmpdir) / "media"
+                )
                 
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("Pandoc conversion timed out")
         except Exception as e:
             logger.error(f"Pandoc conversion failed: {e}")
             raise
 
+    def _build_command(self, tmpdir: str) -> List[str]:
+        """Build the Pandoc command line, forcing pipe tables."""
+        return [
+            'pandoc',
+            str(self.input_path),
+            '-f', 'docx',
+            '-t', PANDOC_MARKDOWN_FORMAT,
+            '--wrap=none',
+            '--markdown-headings=atx',
+            f'--extract-media={tmpdir}',
+        ]
+
+    def _convert_with_server(self) -> str:
+        """Convert by posting the document to a running ``pandoc server``."""
+        options = json.dumps({
+            "from": "docx",
+            "to": PANDOC_MARKDOWN_FORMAT,
+            "wrap": "none",
+        }).encode('utf-8')
+        
+        # Binary input formats are sent base64-encoded. Base64 output needs
+        # no JSON escaping, so splice the encoded bytes in directly rather
+        # than decoding them to str and re-encoding the whole body.
+        payload = b''.join((
+            b'{"text": "',
+            base64.b64encode(self.input_path.read_bytes()),
+            b'", ',
+            options[1:],
+        ))
+        
+        request = urllib.request.Request(
+            self.server_url,
+            data=payload,
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+        )
+        
+        try:
+            with urllib.request.urlopen(request, timeout=PANDOC_TIMEOUT) as response:
+                result = json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            raise RuntimeError(f"Pandoc error: {e.read().decode('utf-8', errors='replace')}")
+        except socket.timeout:
+            raise RuntimeError("Pandoc conversion timed out")
+        
+        if not isinstance(result, dict) or "output" not in result:
+            raise RuntimeError(f"Pandoc error: unexpected server response {result!r}")
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # The server cannot extract media; output references the
+            # package's media/ names, so unpack them from the DOCX instead.
+            media_dir = Path(tmpdir) / "media"
+            if self.extract_images:
+                self._unpack_media(media_dir)
+            return self._process_output(result["output"], media_dir)
+
+    def _unpack_media(self, media_dir: Path) -> None:
+        """Copy word/media/* from the DOCX package into media_dir."""
+        with self._open_package() as package:
+            for name in package.namelist():
+                if not name.startswith('word/media/') or name.endswith('/'):
+                    continue
+                media_dir.mkdir(parents=True, exist_ok=True)
+                with package.open(name) as src, open(media_dir / Path(name).name, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, IMAGE_COPY_BUFFER_SIZE)
+
+    def _process_output(self, markdown: str, media_dir: Path) -> str:
+        """Post-process raw Pandoc output: images, HTML tables and cleanup."""
+        # Extract images and build path mapping
+        path_mapping = {}
+        if self.extract_images and media_dir.exists():
+            path_mapping = self._extract_and_map_images(media_dir)
+        
+        # Replace image paths BEFORE converting HTML tables
+        if path_mapping:
+            markdown = self._replace_image_paths(markdown, path_mapping)
+        elif self.skip_images:
+            markdown = _IMG_STRIP_RE.sub('', markdown)
+        
+        # Convert any HTML tables to Markdown pipe tables
+        markdown = self._convert_html_tables_to_markdown(markdown)
+        
+        # Clean up Pandoc-specific artifacts
+        markdown = self._cleanup_pandoc_output(markdown)
+        
+        # Final pass: update any remaining temp image paths
+        if path_mapping:
+            markdown = self._replace_image_paths(markdown, path_mapping)
+        
+        logger.info("Pandoc conversion completed successfully")
+        return markdown
+
     def _extract_and_map_images(self, media_dir: Path) -> Dict[str, str]:
         """
         Extract images from Pandoc media directory and create path mapping.
@@ -184,18 +422,16 @@ class PandocConverter(BaseConverter):
             return path_mapping
         
         if self.images_dir:
-            self.images_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_images_dir()
         
         for img_file in sorted(image_files, key=lambda x: x.name):
             try:
-                with open(img_file, 'rb') as f:
-                    image_data = f.read()
-                
                 ext = img_file.suffix[1:].lower()
                 if ext in ['emf', 'wmf']:
                     ext = 'png'
                 
-                new_ref = self._process_image(image_data, ext)
+                with open(img_file, 'rb') as f:
+                    new_ref = self._process_image_stream(f, ext)
                 
                 if new_ref:
                     # Map ALL possible path variations
@@ -237,7 +473,7 @@ class PandocConverter(BaseConverter):
             logger.warning(f"No mapping found for temp image: {img_path}")
             return ''
         
-        markdown = re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', replace_md_image, markdown)
+        markdown = _MD_IMAGE_RE.sub(replace_md_image, markdown)
         
         return markdown
 
@@ -266,16 +502,11 @@ class PandocConverter(BaseConverter):
         what Pandoc generates.
         """
         # Find all HTML tables
-        table_pattern = re.compile(r'<table[^>]*>.*?</table>', re.DOTALL | re.IGNORECASE)
-        
         def convert_table(match):
             html_table = match.group(0)
             return self._html_table_to_markdown(html_table)
         
-        markdown = table_pattern.sub(convert_table, markdown)
-        
-        # Also handle tables with colgroup
-        colgroup_table_pattern = re.compile(r'<colgroup>.*?</colgroup>\s*<thead>.*?</tbody>', re.DOTALL | re.IGNORECASE)
+        markdown = _HTML_TABLE_RE.sub(convert_table, markdown)
         
         # Handle orphaned table parts (colgroup, thead, tbody without table wrapper)
         if '<colgroup>' in markdown or '<thead>' in markdown or '<tbody>' in markdown:
@@ -388,7 +619,7 @@ class PandocConverter(BaseConverter):
         content = content.replace('\n', ' ').replace('\r', '')
         
         # Remove multiple spaces
-        content = re.sub(r'\s+', ' ', content)
+        content = _WHITESPACE_RE.sub(' ', content)
         
         # Escape pipe characters
         content = content.replace('|', '\\|')
@@ -410,36 +641,20 @@ class PandocConverter(BaseConverter):
         - Orphaned HTML tags
         - Extra backslashes
         """
-        # Remove image dimension metadata
-        markdown = re.sub(r'\{width="[^"]*"(\s*height="[^"]*")?\}', '', markdown)
-        markdown = re.sub(r'\{height="[^"]*"\}', '', markdown)
-        markdown = re.sub(r'\{style="[^"]*"\}', '', markdown)
-        
-        # Remove other Pandoc attributes
-        markdown = re.sub(r'\{[#.][^}]*\}', '', markdown)
+        # Remove image dimension metadata and other Pandoc attributes
+        markdown = _PANDOC_ATTRIBUTES_RE.sub('', markdown)
         
         # Remove any remaining HTML img tags with temp paths
-        markdown = re.sub(r'<img[^>]*src="[^"]*tmp[^"]*"[^>]*/?\s*>', '', markdown)
-        markdown = re.sub(r'<img[^>]*src="[^"]*var/folders[^"]*"[^>]*/?\s*>', '', markdown)
+        markdown = _TEMP_IMG_TAG_RE.sub('', markdown)
         
         # Remove empty paragraph tags
-        markdown = re.sub(r'<p>\s*</p>', '', markdown)
+        markdown = _EMPTY_PARAGRAPH_RE.sub('', markdown)
         
         # Remove orphaned HTML tags that aren't part of tables
-        markdown = re.sub(r'</?colgroup[^>]*>', '', markdown)
-        markdown = re.sub(r'<col[^>]*/?\s*>', '', markdown)
-        markdown = re.sub(r'</?thead[^>]*>', '', markdown)
-        markdown = re.sub(r'</?tbody[^>]*>', '', markdown)
+        markdown = _ORPHAN_TABLE_TAG_RE.sub('', markdown)
         
         # Remove excessive backslashes
-        markdown = re.sub(r'\\([.,:;!?])', r'\1', markdown)
-        
-        # Clean up multiple blank lines
-        markdown = re.sub(r'\n{3,}', '\n\n', markdown)
-        
-        # Clean up trailing whitespace
-        lines = markdown.split('\n')
-        lines = [line.rstrip() for line in lines]
-        markdown = '\n'.join(lines)
+        markdown = _ESCAPED_PUNCTUATION_RE.sub(r'\1', markdown)
         
-        return markdown
\ No newline at end of file
+        # Collapse blank lines and trim trailing whitespace
+        return self._tidy_lines(markdown)
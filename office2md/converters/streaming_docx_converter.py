@@ -0,0 +1,193 @@
+"""Low-memory DOCX converter streaming word/document.xml with ElementTree."""
+
+import logging
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import Dict, Iterator, Optional
+
+from office2md.converters.base_converter import BaseConverter
+from office2md.converters.basic_docx_converter import (
+    W_B,
+    W_BODY,
+    W_HYPERLINK,
+    W_I,
+    W_NS,
+    W_P,
+    W_R,
+    W_RPR,
+    W_TBL,
+    W_VAL,
+    _is_toggled_on,
+    _paragraph_xml_text,
+    _run_xml_text,
+    table_xml_to_markdown,
+)
+
+logger = logging.getLogger(__name__)
+
+class StreamingDocxConverter(BaseConverter):
+    """
+    Low-memory DOCX converter.
+
+    Reads the DOCX package directly and streams ``word/document.xml`` through
+    ``xml.etree.ElementTree.iterparse``, discarding each top-level block once
+    it has been converted. Peak memory stays proportional to the largest
+    paragraph or table rather than the whole document.
+
+    Output mirrors the basic python-docx converter (headings, lists,
+    bold/italic runs and tables). Images are not extracted.
+    """
+
+    def __init__(
+        self,
+        input_path: str,
+        output_path: Optional[str] = None,
+        **kwargs
+    ):
+        """Initialize streaming DOCX converter."""
+        super().__init__(input_path, output_path, **kwargs)
+        self._style_names: Dict[str, str] = {}
+
+    def convert(self) -> str:
+        """Convert DOCX to Markdown by streaming the document part."""
+        logger.info(f"Converting with streaming DOCX parser: {self.input_path}")
+
+        with self._open_package() as package:
+            self._style_names = self._load_style_names(package)
+
+            with package.open("word/document.xml") as stream:
+                markdown_parts = list(self._iter_blocks(stream))
+
+        if self.extract_images:
+            logger.debug("Image extraction is not supported in streaming mode")
+
+        markdown = '\n\n'.join(markdown_parts)
+        markdown = self._cleanup_markdown(markdown)
+
+        logger.info("Streaming DOCX conversion completed")
+        return markdown
+
+    def _iter_blocks(self, stream) -> Iterator[str]:
+        """Yield Markdown for each top-level paragraph or table in the body."""
+        depth = 0
+        body = None
+
+        for event, elem in ET.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if elem.tag == W_BODY:
+                    body = elem
+                continue
+
+            depth -= 1
+
+            # Only act on direct children of <w:body> (document > body > block)
+            if body is None or depth != 2:
+                continue
+
+            if elem.tag == W_P:
+                md = self._paragraph_to_markdown(elem)
+            elif elem.tag == W_TBL:
+                md = self._table_to_markdown(elem)
+            else:
+                md = ""
+
+            # Drop the converted block so the tree never grows
+            elem.clear()
+            body.remove(elem)
+
+            if md:
+                yield md
+
+    def _load_style_names(self, package: zipfile.ZipFile) -> Dict[str, str]:
+        """Map paragraph style IDs to their display names from word/styles.xml."""
+        names = {}
+
+        try:
+            with package.open("word/styles.xml") as stream:
+                for _, elem in ET.iterparse(stream):
+                    if elem.tag != f"{W_NS}style":
+                        continue
+                    style_id = elem.get(f"{W_NS}styleId")
+                    name = elem.find(f"{W_NS}name")
+                    if style_id and name is not None:
+                        names[style_id] = name.get(W_VAL, style_id)
+                    elem.clear()
+        except KeyError:
+            logger.debug("No styles part found in package")
+
+        return names
+
+    def _style_name(self, para) -> str:
+        """Return the display name of a paragraph's style."""
+        style = para.find(f"{W_NS}pPr/{W_NS}pStyle")
+        if style is None:
+            return ""
+        style_id = style.get(W_VAL, "")
+        return self._style_names.get(style_id, style_id)
+
+    def _iter_runs(self, para):
+        """Yield the runs of a paragraph, including those inside hyperlinks."""
+        for child in para:
+            if child.tag == W_R:
+                yield child
+            elif child.tag == W_HYPERLINK:
+                yield from child.iterfind(W_R)
+
+    def _paragraph_to_markdown(self, para) -> str:
+        """Convert a <w:p> element to Markdown."""
+        text = _paragraph_xml_text(para).strip()
+        if not text:
+            return ""
+
+        # Built-in style names are stored lowercase ("heading 1") in styles.xml
+        style_name = self._style_name(para).lower()
+
+        if style_name.startswith('heading'):
+            try:
+                level = int(style_name.replace('heading', '').strip())
+                return '#' * level + ' ' + text
+            except ValueError:
+                pass
+
+        if style_name == 'title':
+            return '# ' + text
+
+        # Check for list
+        if style_name.startswith('list') or para.find(f"{W_NS}pPr/{W_NS}numPr") is not None:
+            return '- ' + text
+
+        return self._apply_inline_formatting(para)
+
+    def _apply_inline_formatting(self, para) -> str:
+        """Apply bold/italic formatting to paragraph runs."""
+        parts = []
+
+        for run in self._iter_runs(para):
+            text = _run_xml_text(run)
+            if not text:
+                continue
+
+            rpr = run.find(W_RPR)
+            bold = rpr is not None and _is_toggled_on(rpr, W_B)
+            italic = rpr is not None and _is_toggled_on(rpr, W_I)
+
+            if bold and italic:
+                text = f"***{text}***"
+            elif bold:
+                text = f"**{text}**"
+            elif italic:
+                text = f"*{text}*"
+
+            parts.append(text)
+
+        return ''.join(parts)
+
+    def _table_to_markdown(self, table) -> str:
+        """Convert a <w:tbl> element to Markdown."""
+        return table_xml_to_markdown(table)
+
+    def _cleanup_markdown(self, markdown: str) -> str:
+        """Clean up generated Markdown."""
+        # Collapse blank lines, trim trailing whitespace, fix broken bold/italic
+        return self._tidy_lines(markdown, fix_emphasis=True).strip()
@@ -23,6 +23,8 @@ class XlsxConverter(BaseConverter):
         input_path: str,
         output_path: Optional[str] = None,
         include_all_sheets: bool = True,
+        read_only: bool = True,
+        data_only: bool = False,
         **kwargs
     ):
         """
@@ -32,10 +34,15 @@ class XlsxConverter(BaseConverter):
             input_path: Path to input XLSX file
             output_path: Optional output path
             include_all_sheets: Include all sheets (default: True)
+            read_only: Open the workbook in openpyxl's streaming read-only
+                mode, which uses far less memory on large files (default: True)
+            data_only: Read cached cell values instead of formulas (default: False)
             **kwargs: Additional options (extract_images, embed_images, skip_images)
         """
         super().__init__(input_path, output_path, **kwargs)
         self.include_all_sheets = include_all_sheets
+        self.read_only = read_only
+        self.data_only = data_only
 
     def convert(self) -> str:
         """Convert XLSX to Markdown."""
@@ -44,25 +51,33 @@ class XlsxConverter(BaseConverter):
 
         try:
             logger.info("Converting XLSX using openpyxl")
-            workbook = load_workbook(self.input_path)
+            workbook = load_workbook(
+                self.input_path,
+                read_only=self.read_only,
+                data_only=self.data_only,
+            )
 
             markdown_lines = []
 
-            # Determine which sheets to process
-            sheets = workbook.sheetnames
-            if not self.include_all_sheets and sheets:
-                sheets = [sheets[0]]
+            try:
+                # Determine which sheets to process
+                sheets = workbook.sheetnames
+                if not self.include_all_sheets and sheets:
+                    sheets = [sheets[0]]
 
-            for sheet_name in sheets:
-                worksheet = workbook[sheet_name]
+                for sheet_name in sheets:
+                    worksheet = workbook[sheet_name]
 
-                # Add sheet name as heading
-                markdown_lines.append(f"## {sheet_name}")
-                markdown_lines.append("")
+                    # Add sheet name as heading
+                    markdown_lines.append(f"## {sheet_name}")
+                    markdown_lines.append("")
 
-                # Convert sheet to markdown table
-                markdown_lines.append(self._sheet_to_markdown(worksheet))
-                markdown_lines.append("")
+                    # Convert sheet to markdown table
+                    markdown_lines.append(self._sheet_to_markdown(worksheet))
+                    markdown_lines.append("")
+            finally:
+                # Read-only workbooks keep the archive open until closed
+                workbook.close()
 
             return "\n".join(markdown_lines)
 
@@ -82,6 +97,11 @@ class XlsxConverter(BaseConverter):
         """
         rows = []
 
+        if self.read_only:
+            # Read-only sheets trust the stored <dimension> record, which
+            # some writers leave stale (e.g. "A1"); read every row instead
+            worksheet.reset_dimensions()
+
         for i, row in enumerate(worksheet.iter_rows(values_only=True)):
             # Skip empty rows
             if not any(row):
@@ -0,0 +1,207 @@
+"""Tests for BaseConverter."""
+
+import pytest
+
+from office2md.converters.base_converter import (
+    BaseConverter,
+    _b64decode,
+    _encode_pil_image,
+    _write_files,
+)
+
+
+class DummyConverter(BaseConverter):
+    """Minimal concrete converter returning fixed Markdown."""
+
+    def convert(self) -> str:
+        return "# Título\n\nBody"
+
+
+class TestBaseConverter:
+    """Test BaseConverter shared behaviour."""
+
+    def test_accepts_path_objects(self, tmp_path):
+        """Test Path arguments are kept as-is rather than re-wrapped."""
+        input_path = tmp_path / "in.docx"
+        output_path = tmp_path / "out.md"
+        converter = DummyConverter(input_path, output_path)
+
+        assert converter.input_path is input_path
+        assert converter.output_path is output_path
+
+    def test_save_writes_file(self, tmp_path):
+        """Test save() creates parent directories and writes UTF-8 Markdown."""
+        output_path = tmp_path / "nested" / "out.md"
+        converter = DummyConverter(str(tmp_path / "in.docx"), str(output_path))
+
+        converter.save()
+
+        assert output_path.read_bytes() == "# Título\n\nBody".encode("utf-8")
+
+    def test_convert_and_save(self, tmp_path):
+        """Test convert_and_save() converts before writing the output."""
+        output_path = tmp_path / "out.md"
+        DummyConverter(str(tmp_path / "in.docx"), str(output_path)).convert_and_save()
+
+        assert output_path.read_text(encoding="utf-8") == "# Título\n\nBody"
+
+    def test_save_writes_text_in_slices(self, tmp_path, monkeypatch):
+        """Test save() encodes large text slice by slice, multibyte characters included."""
+        from office2md.converters import base_converter
+
+        monkeypatch.setattr(base_converter, "TEXT_ENCODE_CHUNK_SIZE", 4)
+        output_path = tmp_path / "nested" / "out.md"
+        output_path.parent.mkdir()
+        output_path.write_text("old content that is longer than the new one")
+        converter = DummyConverter(str(tmp_path / "in.docx"), str(output_path))
+
+        converter.save("Título ✓ é\n")
+
+        assert output_path.read_bytes() == "Título ✓ é\n".encode("utf-8")
+
+    def test_save_truncates_existing_file(self, tmp_path):
+        """Test save() replaces previous content."""
+        output_path = tmp_path / "out.md"
+        output_path.write_text("old content that is longer")
+        converter = DummyConverter(str(tmp_path / "in.docx"), str(output_path))
+
+        converter.save("new")
+
+        assert output_path.read_bytes() == b"new"
+
+    def test_process_image_stream(self, tmp_path):
+        """Test images copied from a stream are saved and referenced."""
+        import io
+
+        converter = DummyConverter(str(tmp_path / "in.docx"), str(tmp_path / "out.md"))
+        ref = converter._process_image_stream(io.BytesIO(b"\x89PNG data"), "png")
+
+        assert ref == "![](./out_images/image_1.png)"
+        assert (tmp_path / "out_images" / "image_1.png").read_bytes() == b"\x89PNG data"
+
+    def test_process_image_deduplicates(self, tmp_path):
+        """Test identical image bytes are written once and share a reference."""
+        converter = DummyConverter(str(tmp_path / "in.pptx"), str(tmp_path / "out.md"))
+
+        first = converter._process_image(b"logo", "png")
+        second = converter._process_image(b"logo", "png")
+        other = converter._process_image(b"chart", "png")
+
+        assert first == second == "![](./out_images/image_1.png)"
+        assert other == "![](./out_images/image_2.png)"
+        assert sorted(p.name for p in (tmp_path / "out_images").iterdir()) == [
+            "image_1.png",
+            "image_2.png",
+        ]
+
+    def test_encode_pil_image_keeps_encoded_source(self):
+        """Test undecoded JPEGs keep their source bytes and decoded images become PNG."""
+        import io
+
+        from PIL import Image
+
+        buf = io.BytesIO()
+        Image.new("RGB", (8, 8), (0, 0, 255)).save(buf, format="JPEG")
+        source = buf.getvalue()
+
+        with Image.open(io.BytesIO(source)) as image:
+            assert _encode_pil_image(image) == (source, "jpg")
+
+        data, extension = _encode_pil_image(Image.new("RGB", (4, 4), "red"))
+        assert extension == "png"
+        with Image.open(io.BytesIO(data)) as decoded:
+            assert decoded.getpixel((0, 0)) == (255, 0, 0)
+
+    def test_process_image_into_output_directory(self, tmp_path):
+        """Test images saved next to the output are referenced by bare filename."""
+        converter = DummyConverter(
+            str(tmp_path / "in.docx"), str(tmp_path / "out.md"), images_dir=tmp_path
+        )
+
+        assert converter._process_image(b"logo", "png") == "![](./image_1.png)"
+        assert (tmp_path / "image_1.png").read_bytes() == b"logo"
+
+    def test_process_image_into_nested_directory(self, tmp_path):
+        """Test images in a nested directory are linked with forward slashes."""
+        converter = DummyConverter(
+            str(tmp_path / "in.docx"),
+            str(tmp_path / "out.md"),
+            images_dir=tmp_path / "assets" / "img",
+        )
+
+        assert converter._process_image(b"logo", "png") == "![](./assets/img/image_1.png)"
+
+    def test_write_files_skips_failures(self, tmp_path):
+        """Test queued images are all written, and a failing path does not stop the rest."""
+        writes = [
+            (str(tmp_path / "a.png"), b"a"),
+            (str(tmp_path / "missing" / "b.png"), b"b"),
+            (str(tmp_path / "c.png"), b"c"),
+        ]
+
+        assert _write_files(writes) == [str(tmp_path / "missing" / "b.png")]
+        assert _write_files(writes[1:2]) == [str(tmp_path / "missing" / "b.png")]
+        assert (tmp_path / "a.png").read_bytes() == b"a"
+        assert (tmp_path / "c.png").read_bytes() == b"c"
+        assert not (tmp_path / "missing").exists()
+
+    def test_generate_image_hash(self, tmp_path):
+        """Test image hashes are short, stable and content-dependent."""
+        converter = DummyConverter(str(tmp_path / "in.docx"))
+
+        digest = converter._generate_image_hash(b"logo")
+
+        assert len(digest) == 8
+        assert digest == converter._generate_image_hash(b"logo")
+        assert digest != converter._generate_image_hash(b"chart")
+
+    def test_b64decode_skips_whitespace(self):
+        """Test base64 decoding tolerates embedded whitespace without pybase64."""
+        from unittest.mock import patch
+
+        with patch("office2md.converters.base_converter.PYBASE64_AVAILABLE", False):
+            assert _b64decode("bG9n\r\n bw==") == b"logo"
+
+    def test_replace_base64_images(self, tmp_path):
+        """Test inline base64 images are extracted or stripped."""
+        markdown = "Logo: ![alt](data:image/png;base64,bG9n bw==)"
+
+        converter = DummyConverter(str(tmp_path / "in.docx"), str(tmp_path / "out.md"))
+        assert converter._replace_base64_images(markdown) == "Logo: ![](./out_images/image_1.png)"
+        assert (tmp_path / "out_images" / "image_1.png").read_bytes() == b"logo"
+
+        converter = DummyConverter(str(tmp_path / "in.docx"), skip_images=True)
+        assert converter._replace_base64_images(markdown) == "Logo: "
+
+    def test_open_package_reads_members(self, tmp_path):
+        """Test _open_package() exposes ZIP members through the memory map."""
+        import zipfile
+
+        input_path = tmp_path / "in.docx"
+        with zipfile.ZipFile(input_path, "w") as package:
+            package.writestr("word/document.xml", "<doc/>")
+
+        converter = DummyConverter(str(input_path))
+        with converter._open_package() as package:
+            assert package.read("word/document.xml") == b"<doc/>"
+
+    def test_open_package_empty_file(self, tmp_path):
+        """Test empty inputs fall back to a regular file and fail as bad ZIPs."""
+        import zipfile
+
+        input_path = tmp_path / "empty.docx"
+        input_path.write_bytes(b"")
+
+        converter = DummyConverter(str(input_path))
+        with pytest.raises(zipfile.BadZipFile):
+            with converter._open_package():
+                pass
+
+    def test_tidy_lines(self, tmp_path):
+        """Test blank lines collapse and trailing whitespace is trimmed in one pass."""
+        converter = DummyConverter(str(tmp_path / "in.docx"))
+
+        markdown = "a  \n\n\n \nb\t\n******c****"
+
+        assert converter._tidy_lines(markdown) == "a\n\nb\n******c****"
+        assert converter._tidy_lines(markdown, fix_emphasis=True) == "a\n\nb\n**c**"
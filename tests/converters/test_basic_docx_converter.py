@@ -0,0 +1,176 @@
+"""Tests for BasicDocxConverter."""
+
+import pytest
+
+from office2md.converters.basic_docx_converter import BasicDocxConverter
+
+
+class TestBasicDocxConverter:
+    """Test suite for BasicDocxConverter."""
+
+    @pytest.fixture
+    def table_docx(self, tmp_path):
+        """Create a DOCX with a table containing merged cells."""
+        from docx import Document
+
+        doc_path = tmp_path / "table.docx"
+        doc = Document()
+        table = doc.add_table(rows=3, cols=3)
+        for r in range(3):
+            for c in range(3):
+                table.cell(r, c).text = f"R{r}C{c}"
+        table.cell(0, 0).merge(table.cell(0, 1))
+        table.cell(1, 2).merge(table.cell(2, 2))
+        table.cell(2, 0).text = "a | b"
+        table.cell(1, 0).text = "line\nbreak\ttab"
+        doc.save(doc_path)
+        return doc_path
+
+    def test_fast_tables_match_python_docx(self, table_docx):
+        """Test the XML table walker matches python-docx output, merges included."""
+        fast = BasicDocxConverter(str(table_docx), skip_images=True).convert()
+        slow = BasicDocxConverter(
+            str(table_docx), fast_tables=False, skip_images=True
+        ).convert()
+
+        assert fast == slow
+        assert "a \\| b" in fast
+
+    def test_iter_table_rows_matches_row_cells(self, table_docx):
+        """Test iter_table_rows() yields the same texts as python-docx row.cells."""
+        from docx import Document
+
+        from office2md.converters.basic_docx_converter import iter_table_rows
+
+        table = Document(str(table_docx)).tables[0]
+
+        expected = [[cell.text for cell in row.cells] for row in table.rows]
+        assert list(iter_table_rows(table._tbl)) == expected
+
+    @pytest.fixture
+    def text_box_docx(self, tmp_path):
+        """Create a DOCX whose table cell holds a text box, a hyperlink and special runs."""
+        from docx import Document
+        from docx.oxml import parse_xml
+
+        w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+        mc = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+        text_box = (
+            f'<w:r xmlns:w="{w}" xmlns:mc="{mc}"><mc:AlternateContent>'
+            '<mc:Choice Requires="wps"><w:drawing><w:txbxContent><w:p>'
+            '<w:r><w:t>BOX</w:t></w:r></w:p></w:txbxContent></w:drawing></mc:Choice>'
+            '<mc:Fallback><w:pict><w:txbxContent><w:p>'
+            '<w:r><w:t>BOX</w:t></w:r></w:p></w:txbxContent></w:pict></mc:Fallback>'
+            '</mc:AlternateContent></w:r>'
+        )
+        special = (
+            f'<w:r xmlns:w="{w}"><w:t>a</w:t><w:noBreakHyphen/><w:t>b</w:t>'
+            '<w:ptab w:relativeTo="margin" w:alignment="right" w:leader="none"/>'
+            '<w:br w:type="page"/><w:t>c</w:t></w:r>'
+        )
+        link = f'<w:hyperlink xmlns:w="{w}"><w:r><w:t> link</w:t></w:r></w:hyperlink>'
+
+        doc_path = tmp_path / "text_box.docx"
+        doc = Document()
+        table = doc.add_table(rows=1, cols=2)
+        cell_p = table.cell(0, 0).paragraphs[0]
+        cell_p.add_run("Cell")
+        cell_p._p.append(parse_xml(text_box))
+        cell_p._p.append(parse_xml(link))
+        table.cell(0, 1).paragraphs[0]._p.append(parse_xml(special))
+        doc.save(doc_path)
+        return doc_path
+
+    def test_iter_table_rows_skips_text_boxes(self, text_box_docx):
+        """Test cell text only includes the paragraph's own and hyperlink runs."""
+        from docx import Document
+
+        from office2md.converters.basic_docx_converter import iter_table_rows
+
+        table = Document(str(text_box_docx)).tables[0]
+
+        expected = [[cell.text for cell in row.cells] for row in table.rows]
+        assert expected == [["Cell link", "a-b\tc"]]
+        assert list(iter_table_rows(table._tbl)) == expected
+
+    def test_inline_formatting(self, tmp_path):
+        """Test plain paragraphs take the fast path and formatted runs are wrapped."""
+        from docx import Document
+
+        doc_path = tmp_path / "inline.docx"
+        doc = Document()
+        doc.add_paragraph().add_run("Plain text")
+        para = doc.add_paragraph()
+        para.add_run("Mixed ")
+        para.add_run("bold").bold = True
+        para.add_run(" and ")
+        para.add_run("off").bold = False
+        doc.add_paragraph().add_run("slanted").italic = True
+        run = doc.add_paragraph().add_run("both")
+        run.bold = run.italic = True
+        doc.save(doc_path)
+
+        markdown = BasicDocxConverter(str(doc_path), skip_images=True).convert()
+
+        assert "Plain text" in markdown
+        assert "Mixed **bold** and off" in markdown
+        assert "\n*slanted*\n" in markdown
+        assert markdown.endswith("***both***")
+
+    def test_heading_title_and_list_styles(self, tmp_path):
+        """Test paragraph styles map to headings, titles and list items."""
+        from docx import Document
+
+        doc_path = tmp_path / "styles.docx"
+        doc = Document()
+        doc.add_heading("Doc Title", level=0)
+        doc.add_heading("Chapter", level=1)
+        doc.add_heading("Section", level=3)
+        doc.add_paragraph("Another chapter", style="Heading 1")
+        doc.add_paragraph("Item", style="List Bullet")
+        doc.save(doc_path)
+
+        converter = BasicDocxConverter(str(doc_path), skip_images=True)
+        markdown = converter.convert()
+
+        assert markdown.splitlines()[::2] == [
+            "# Doc Title", "# Chapter", "### Section", "# Another chapter", "- Item",
+        ]
+        # One lookup per distinct style
+        assert len(converter._style_names) == 4
+
+    def test_extract_images_writes_each_distinct_image(self, tmp_path):
+        """Test images are written concurrently, once each, in document order."""
+        import io
+
+        from docx import Document
+        from PIL import Image
+
+        images = []
+        for color in ("red", "green", "blue"):
+            buf = io.BytesIO()
+            Image.new("RGB", (4, 4), color).save(buf, format="PNG")
+            images.append(buf.getvalue())
+
+        doc_path = tmp_path / "images.docx"
+        doc = Document()
+        for data in images + images[:1]:
+            doc.add_picture(io.BytesIO(data))
+        doc.save(doc_path)
+
+        output = tmp_path / "out" / "images.md"
+        converter = BasicDocxConverter(str(doc_path), str(output))
+        converter.convert()
+
+        written = sorted(converter.images_dir.iterdir())
+        assert [p.name for p in written] == ["image_1.png", "image_2.png", "image_3.png"]
+        assert sorted(p.read_bytes() for p in written) == sorted(images)
+
+    def test_rows_to_markdown_pads_short_rows(self):
+        """Test ragged rows are padded to the widest row."""
+        from office2md.converters.basic_docx_converter import rows_to_markdown
+
+        assert rows_to_markdown([["A", "B"], ["1"], []]) == (
+            "| A | B |\n| --- | --- |\n| 1 |  |\n|  |  |"
+        )
+        assert rows_to_markdown([]) == ""
@@ -63,4 +63,251 @@ class TestDoclingConverter:
         converter = DoclingConverter(str(sample_docx), skip_images=True)
         
         with pytest.raises(Exception, match="Docling error"):
-            converter.convert()
\ No newline at end of file
+            converter.convert()
+
+    @patch('office2md.converters.docling_converter.DOCLING_AVAILABLE', True)
+    @patch('office2md.converters.docling_converter.DocumentConverter', create=True)
+    def test_document_converter_is_reused(self, mock_docling_class, tmp_path):
+        """Test the Docling DocumentConverter is created once and shared."""
+        from office2md.converters.docling_converter import (
+            DoclingConverter,
+            _create_document_converter,
+        )
+        
+        _create_document_converter.cache_clear()
+        mock_docling_class.return_value.convert.return_value.document.export_to_markdown.return_value = "# PDF"
+        
+        for name in ("a.pdf", "b.pdf"):
+            pdf_path = tmp_path / name
+            pdf_path.write_bytes(b"%PDF-1.4")
+            converter = DoclingConverter(
+                str(pdf_path), skip_images=True, force_ocr=True, pdf_backend=None
+            )
+            assert converter.convert() == "# PDF"
+        
+        _create_document_converter.cache_clear()
+        mock_docling_class.assert_called_once_with()
+
+    @patch('office2md.converters.docling_converter.DOCLING_AVAILABLE', True)
+    @patch('office2md.converters.docling_converter.get_document_converter')
+    def test_ocr_only_when_text_layer_is_sparse(self, mock_get_converter, tmp_path):
+        """Test the OCR pipeline runs only when the text-only pass finds little text."""
+        from office2md.converters.docling_converter import (
+            FAST_PIPELINE_OPTIONS,
+            DoclingConverter,
+        )
+        
+        fast, full = MagicMock(), MagicMock()
+        mock_get_converter.side_effect = lambda options=(), backend=None: fast if options else full
+        full.convert.return_value.document.export_to_markdown.return_value = "# OCR text"
+        
+        pdf_path = tmp_path / "doc.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        
+        fast_doc = fast.convert.return_value.document
+        fast_doc.pages = {1: MagicMock()}
+        fast_doc.export_to_markdown.return_value = "Text layer " * 20
+        assert DoclingConverter(str(pdf_path), skip_images=True).convert().startswith("Text layer")
+        full.convert.assert_not_called()
+        
+        fast_doc.export_to_markdown.return_value = "<!-- image -->"
+        assert DoclingConverter(str(pdf_path), skip_images=True).convert() == "# OCR text"
+        full.convert.assert_called_once()
+        mock_get_converter.assert_any_call(FAST_PIPELINE_OPTIONS, "pypdfium2")
+
+    @patch('office2md.converters.docling_converter.DOCLING_AVAILABLE', True)
+    @patch('office2md.converters.docling_converter.get_document_converter')
+    def test_convert_many_uses_convert_all(self, mock_get_converter, tmp_path):
+        """Test convert_many() converts in one batch and skips failed documents."""
+        import sys
+        from types import SimpleNamespace
+        
+        from office2md.converters.docling_converter import DoclingConverter
+        
+        status = SimpleNamespace(SUCCESS="success", PARTIAL_SUCCESS="partial")
+        settings = SimpleNamespace(perf=SimpleNamespace(doc_batch_size=2))
+        fake_modules = {
+            "docling.datamodel.base_models": SimpleNamespace(ConversionStatus=status),
+            "docling.datamodel.settings": SimpleNamespace(settings=settings),
+        }
+        
+        def result(text, result_status="success"):
+            document = MagicMock(pages={1: None})
+            document.export_to_markdown.return_value = text
+            return SimpleNamespace(status=result_status, document=document)
+        
+        paths = []
+        for name in ("a.pdf", "b.pdf", "c.pdf"):
+            paths.append(tmp_path / name)
+            paths[-1].write_bytes(b"%PDF-1.4")
+        
+        convert_all = mock_get_converter.return_value.convert_all
+        convert_all.side_effect = lambda sources, raises_on_error: iter([
+            result("A " * 64), result("", "failure"), result("C " * 64, "partial"),
+        ])
+        
+        with patch.dict(sys.modules, fake_modules):
+            results = DoclingConverter.convert_many(paths, skip_images=True)
+        
+        assert list(results) == [paths[0], paths[2]]
+        assert results[paths[2]].startswith("C C")
+        convert_all.assert_called_once_with([str(p) for p in paths], raises_on_error=False)
+        assert settings.perf.doc_batch_size == 2
+
+    @patch('office2md.converters.docling_converter.DOCLING_AVAILABLE', True)
+    def test_ocr_pages_in_parallel(self, tmp_path):
+        """Test OCR page ranges are joined in order with their own images."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        from office2md.converters.docling_converter import DoclingConverter
+        
+        def fake_convert_range(input_path, page_range, pdf_backend, with_images):
+            start, end = page_range
+            return f"Pages {start}-{end}\n\n<!-- image -->", [(b"img%d" % start, "png")]
+        
+        pdf_path = tmp_path / "scan.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        converter = DoclingConverter(
+            str(pdf_path), str(tmp_path / "scan.md"), force_ocr=True, ocr_parallelism=2
+        )
+        
+        with patch('office2md.converters.docling_converter._count_pdf_pages', return_value=20), \
+                patch('office2md.converters.docling_converter._convert_page_range', fake_convert_range), \
+                patch('office2md.converters.docling_converter.ProcessPoolExecutor', ThreadPoolExecutor):
+            markdown = converter.convert()
+        
+        assert markdown == "\n\n".join(
+            f"Pages {start}-{end}\n\n![](./scan_images/image_{i}.png)"
+            for i, (start, end) in enumerate([(1, 8), (9, 16), (17, 20)], 1)
+        )
+        assert (tmp_path / "scan_images" / "image_3.png").read_bytes() == b"img17"
+
+    @patch('office2md.converters.docling_converter.DOCLING_AVAILABLE', True)
+    @patch('office2md.converters.docling_converter.get_document_converter')
+    def test_parallel_ocr_short_pdf_converts_once(self, mock_get_converter, tmp_path):
+        """Test a short PDF still sparse after OCR is converted serially, once."""
+        from office2md.converters.docling_converter import DoclingConverter
+
+        pdf_path = tmp_path / "photo.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        doc = mock_get_converter.return_value.convert.return_value.document
+        doc.pages = {1: MagicMock(), 2: MagicMock(), 3: MagicMock()}
+        doc.export_to_markdown.return_value = "Fig."
+        converter = DoclingConverter(str(pdf_path), skip_images=True, ocr_parallelism=4)
+
+        with patch('office2md.converters.docling_converter._count_pdf_pages', return_value=3):
+            assert converter.convert() == "Fig."
+
+        assert mock_get_converter.return_value.convert.call_count == 2
+
+    @patch('office2md.converters.docling_converter.DOCLING_AVAILABLE', True)
+    @patch('office2md.converters.docling_converter.get_document_converter')
+    def test_images_extracted_only_with_placeholders(self, mock_get_converter, tmp_path):
+        """Test image extraction is skipped when the Markdown has no image placeholders."""
+        from office2md.converters.docling_converter import DoclingConverter
+        
+        pdf_path = tmp_path / "doc.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        doc = mock_get_converter.return_value.convert.return_value.document
+        doc.pages = {1: MagicMock()}
+        
+        for text, extracted in (("Text " * 20, False), ("Text " * 20 + "\n<!-- image -->", True)):
+            doc.export_to_markdown.return_value = text
+            converter = DoclingConverter(str(pdf_path))
+            with patch.object(converter, "_extract_all_images") as mock_extract:
+                converter.convert()
+            assert mock_extract.called is extracted
+
+    @patch('office2md.converters.docling_converter.DOCLING_AVAILABLE', True)
+    def test_unknown_pdf_backend_raises(self, tmp_path):
+        """Test an unknown PDF backend name is rejected."""
+        from office2md.converters.docling_converter import DoclingConverter
+        
+        pdf_path = tmp_path / "doc.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        
+        with pytest.raises(ValueError, match="Unknown PDF backend"):
+            DoclingConverter(str(pdf_path), pdf_backend="pdfminer")
+
+    @patch('office2md.converters.docling_converter.DOCLING_AVAILABLE', True)
+    def test_repeated_picture_recorded_once(self, tmp_path):
+        """Test a picture reached through several paths is saved and listed once."""
+        from types import SimpleNamespace
+        
+        from office2md.converters.docling_converter import DoclingConverter
+        
+        pdf_path = tmp_path / "doc.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        converter = DoclingConverter(str(pdf_path), str(tmp_path / "doc.md"))
+        
+        picture = SimpleNamespace(data=b"logo")
+        assert converter._extract_picture(picture) == converter._extract_picture(picture)
+        
+        assert converter._extracted_images == ["![](./doc_images/image_1.png)"]
+        assert [p.name for p in (tmp_path / "doc_images").iterdir()] == ["image_1.png"]
+
+    @patch('office2md.converters.docling_converter.DOCLING_AVAILABLE', True)
+    def test_extract_all_images_keeps_document_order(self, tmp_path):
+        """Test images encoded on the pool are saved in document order."""
+        from types import SimpleNamespace
+        
+        from PIL import Image
+        
+        from office2md.converters.docling_converter import DoclingConverter
+        
+        pdf_path = tmp_path / "doc.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        converter = DoclingConverter(str(pdf_path), str(tmp_path / "doc.md"))
+        
+        pictures = [
+            SimpleNamespace(pil_image=Image.new("RGB", (4, 4), color))
+            for color in ("red", "green", "blue")
+        ]
+        doc = SimpleNamespace(
+            pictures=pictures,
+            iterate_items=lambda: [(pictures[0], 1)],
+        )
+        converter._extract_all_images(doc)
+        
+        assert converter._extracted_images == [
+            f"![](./doc_images/image_{i}.png)" for i in (1, 2, 3)
+        ]
+        with Image.open(tmp_path / "doc_images" / "image_2.png") as saved:
+            assert saved.getpixel((0, 0)) == (0, 128, 0)
+
+    @patch('office2md.converters.docling_converter.DOCLING_AVAILABLE', True)
+    def test_extract_data_uri_image(self, tmp_path):
+        """Test base64 data URIs are decoded from the payload after the prefix."""
+        import base64
+        from types import SimpleNamespace
+        
+        from office2md.converters.docling_converter import DoclingConverter
+        
+        pdf_path = tmp_path / "doc.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        converter = DoclingConverter(str(pdf_path), str(tmp_path / "doc.md"))
+        
+        payload = base64.b64encode(b"\x89PNG" + bytes(range(256))).decode()
+        image = SimpleNamespace(uri=f"data:image/png;base64,{payload[:40]}\n{payload[40:]}")
+        
+        assert converter._extract_image_object(image) == "![](./doc_images/image_1.png)"
+        assert (tmp_path / "doc_images" / "image_1.png").read_bytes() == b"\x89PNG" + bytes(range(256))
+
+    @patch('office2md.converters.docling_converter.DOCLING_AVAILABLE', True)
+    def test_replace_image_placeholders(self, tmp_path):
+        """Test placeholders are filled in document order and extras appended."""
+        from office2md.converters.docling_converter import DoclingConverter
+        
+        pdf_path = tmp_path / "doc.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        converter = DoclingConverter(str(pdf_path))
+        converter._extracted_images = ["![](a.png)", "![](b.png)", "![](c.png)"]
+        
+        result = converter._replace_image_placeholders("[image1]\n<!-- image -->\n[[image]]")
+        
+        assert result == "![](a.png)\n![](b.png)\n![](c.png)"
+        
+        converter._extracted_images = ["![](a.png)", "![](b.png)"]
+        assert converter._replace_image_placeholders("<!-- image -->") == (
+            "![](a.png)\n\n\n![](b.png)\n"
+        )
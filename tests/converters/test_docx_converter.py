@@ -123,6 +123,33 @@ class TestDocxConverter:
         assert converter.embed_images is True
         assert converter.extract_images is False
 
+    def test_large_document_streams_without_images(self, sample_docx):
+        """Test basic extraction streams large documents when images are skipped."""
+        with patch("office2md.converters.docx_converter.STREAMING_DOCUMENT_SIZE", 0):
+            converter = DocxConverter(str(sample_docx), use_basic=True, skip_images=True)
+            result = converter.convert()
+            assert converter.converter_used == "streaming-docx"
+            assert "Header 1" in result
+
+            converter = DocxConverter(str(sample_docx), use_basic=True)
+            converter.convert()
+            assert converter.converter_used != "streaming-docx"
+
+    def test_import_does_not_load_backends(self):
+        """Test importing the module only checks which backends are installed, without asyncio."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, shutil; shutil.which = None; "
+            "import office2md.converters.docx_converter; "
+            "print(sorted(m for m in ('asyncio', 'docx', 'lxml', 'mammoth') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
 
 class TestDocxConverterBoldFormatting:
     """Test bold formatting fixes."""
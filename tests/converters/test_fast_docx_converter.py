@@ -0,0 +1,73 @@
+"""Tests for FastDocxConverter."""
+
+import pytest
+
+
+class TestFastDocxConverter:
+    """Test suite for FastDocxConverter."""
+
+    @pytest.fixture
+    def sample_docx(self, tmp_path):
+        """Create a sample DOCX file with an image."""
+        from docx import Document
+        from PIL import Image
+
+        image_path = tmp_path / "pixel.png"
+        Image.new("RGB", (1, 1)).save(image_path)
+
+        doc_path = tmp_path / "test.docx"
+        doc = Document()
+        doc.add_heading("Fast Test", level=2)
+        doc.add_paragraph("Body text")
+        doc.add_picture(str(image_path))
+        doc.save(doc_path)
+        return doc_path
+
+    def test_convert_document(self, sample_docx, tmp_path):
+        """Test conversion and image extraction."""
+        from office2md.converters.fast_docx_converter import FastDocxConverter
+
+        output_path = tmp_path / "out.md"
+        markdown = FastDocxConverter(str(sample_docx), str(output_path)).convert()
+
+        assert "## Fast Test" in markdown
+        assert "Body text" in markdown
+        assert (tmp_path / "out_images" / "image_1.png").exists()
+
+    def test_use_basic_selects_fast_converter(self, sample_docx):
+        """Test DocxConverter(use_basic=True) routes to the fast converter."""
+        from office2md.converters.docx_converter import DocxConverter
+
+        converter = DocxConverter(str(sample_docx), use_basic=True, skip_images=True)
+        markdown = converter.convert()
+
+        assert converter.converter_used == "fast-docx"
+        assert "## Fast Test" in markdown
+
+    def test_merged_table_matches_basic_converter(self, tmp_path):
+        """Test spanned and vertically merged cells and page breaks match python-docx output."""
+        from docx import Document
+        from docx.enum.text import WD_BREAK
+
+        from office2md.converters.basic_docx_converter import BasicDocxConverter
+        from office2md.converters.fast_docx_converter import FastDocxConverter
+
+        doc_path = tmp_path / "merged.docx"
+        doc = Document()
+        table = doc.add_table(rows=3, cols=3)
+        for r in range(3):
+            for c in range(3):
+                table.cell(r, c).text = f"r{r}c{c}"
+        table.cell(0, 0).merge(table.cell(0, 1))
+        table.cell(1, 2).merge(table.cell(2, 2))
+        table.cell(2, 0).text = "a | b"
+        run = doc.add_paragraph().add_run("before")
+        run.add_break(WD_BREAK.PAGE)
+        run.add_text("after")
+        doc.save(doc_path)
+
+        markdown = FastDocxConverter(str(doc_path), skip_images=True).convert()
+
+        assert markdown == BasicDocxConverter(str(doc_path), skip_images=True).convert()
+        assert "| r0c0 r0c1 | r0c0 r0c1 | r0c2 |" in markdown
+        assert "| a \\| b | r2c1 | r1c2 r2c2 |" in markdown
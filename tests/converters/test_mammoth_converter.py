@@ -0,0 +1,71 @@
+"""Tests for MammothConverter."""
+
+from office2md.converters.mammoth_converter import MammothConverter
+
+
+class TestMammothConverter:
+    """Test suite for MammothConverter."""
+
+    def test_table_to_markdown_skips_text_boxes(self, tmp_path):
+        """Test the python-docx table fallback does not repeat text-box content."""
+        from docx import Document
+        from docx.oxml import parse_xml
+
+        w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+        mc = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+        text_box = (
+            f'<w:r xmlns:w="{w}" xmlns:mc="{mc}"><mc:AlternateContent>'
+            '<mc:Choice Requires="wps"><w:drawing><w:txbxContent><w:p>'
+            '<w:r><w:t>BOX</w:t></w:r></w:p></w:txbxContent></w:drawing></mc:Choice>'
+            '<mc:Fallback><w:pict><w:txbxContent><w:p>'
+            '<w:r><w:t>BOX</w:t></w:r></w:p></w:txbxContent></w:pict></mc:Fallback>'
+            '</mc:AlternateContent></w:r>'
+        )
+
+        doc_path = tmp_path / "text_box.docx"
+        doc = Document()
+        table = doc.add_table(rows=2, cols=1)
+        table.cell(0, 0).text = "Header"
+        cell_p = table.cell(1, 0).paragraphs[0]
+        cell_p.add_run("Cell")
+        cell_p._p.append(parse_xml(text_box))
+        doc.save(doc_path)
+
+        converter = MammothConverter(str(doc_path), skip_images=True)
+        table = Document(str(doc_path)).tables[0]
+
+        assert converter._table_to_markdown(table) == "| Header |\n| --- |\n| Cell |"
+
+    def test_failed_image_write_drops_reference(self, tmp_path):
+        """Test an image that cannot be written is not linked from the Markdown."""
+        import io
+        from unittest.mock import patch
+
+        from docx import Document
+        from PIL import Image
+
+        from office2md.converters import base_converter
+
+        doc_path = tmp_path / "images.docx"
+        doc = Document()
+        for color in ("red", "blue"):
+            buf = io.BytesIO()
+            Image.new("RGB", (4, 4), color).save(buf, format="PNG")
+            buf.seek(0)
+            doc.add_picture(buf)
+        doc.save(doc_path)
+
+        write_file = base_converter._write_file
+
+        def fail_second(path, data):
+            if path.endswith("image_2.png"):
+                raise OSError("disk full")
+            write_file(path, data)
+
+        converter = MammothConverter(str(doc_path), str(tmp_path / "out.md"))
+        with patch.object(base_converter, "_write_file", fail_second):
+            markdown = converter.convert()
+
+        assert "![](./out_images/image_1.png)" in markdown
+        assert "image_2" not in markdown
+        assert (tmp_path / "out_images" / "image_1.png").exists()
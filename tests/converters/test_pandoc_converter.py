@@ -1,8 +1,9 @@
 """Tests for Pandoc converter."""
 
+import asyncio
 import pytest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 import subprocess
 
 from office2md.converters.pandoc_converter import PandocConverter, is_pandoc_available
@@ -111,4 +112,95 @@ class TestPandocConverter:
         converter = PandocConverter(str(sample_docx), skip_images=True)
         
         with pytest.raises(RuntimeError, match="timed out"):
-            converter.convert()
\ No newline at end of file
+            converter.convert()
+
+    @patch('office2md.converters.pandoc_converter.PANDOC_AVAILABLE', True)
+    @patch('asyncio.create_subprocess_exec')
+    def test_convert_async_returns_markdown(self, mock_exec, sample_docx):
+        """Test convert_async() awaits Pandoc and returns markdown."""
+        process = MagicMock(returncode=0)
+        process.communicate = AsyncMock(return_value=(b"# Heading\n\nText", b""))
+        mock_exec.return_value = process
+        
+        converter = PandocConverter(str(sample_docx), skip_images=True)
+        result = asyncio.run(converter.convert_async())
+        
+        assert mock_exec.call_args[0][0] == 'pandoc'
+        assert result == "# Heading\n\nText"
+
+    @patch('office2md.converters.pandoc_converter.PANDOC_AVAILABLE', True)
+    @patch('asyncio.create_subprocess_exec')
+    def test_convert_async_handles_pandoc_error(self, mock_exec, sample_docx):
+        """Test convert_async() raises on Pandoc errors."""
+        process = MagicMock(returncode=1)
+        process.communicate = AsyncMock(return_value=(b"", b"invalid input"))
+        mock_exec.return_value = process
+        
+        converter = PandocConverter(str(sample_docx), skip_images=True)
+        
+        with pytest.raises(RuntimeError, match="Pandoc error"):
+            asyncio.run(converter.convert_async())
+
+
+    @patch('office2md.converters.pandoc_converter.PANDOC_AVAILABLE', True)
+    @patch('urllib.request.urlopen')
+    def test_convert_with_server(self, mock_urlopen, sample_docx):
+        """Test convert() posts to a running pandoc server when configured."""
+        import base64
+        import json
+        
+        response = MagicMock()
+        response.read.return_value = json.dumps({"output": "# Heading\n\nText"}).encode()
+        mock_urlopen.return_value.__enter__.return_value = response
+        
+        converter = PandocConverter(
+            str(sample_docx), server_url="http://127.0.0.1:3030/", skip_images=True
+        )
+        result = converter.convert()
+        
+        request = mock_urlopen.call_args[0][0]
+        payload = json.loads(request.data)
+        assert request.full_url == "http://127.0.0.1:3030/"
+        assert payload["from"] == "docx"
+        assert base64.b64decode(payload["text"]) == sample_docx.read_bytes()
+        assert result == "# Heading\n\nText"
+
+
+class TestPandocImport:
+    """Test what importing the Pandoc converter loads."""
+
+    def test_import_does_not_load_asyncio(self):
+        """Test asyncio is only imported by the async conversion path."""
+        import sys
+
+        code = (
+            "import sys; import office2md.converters.pandoc_converter; "
+            "print('asyncio' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+
+class TestPandocServer:
+    """Test suite for PandocServer."""
+
+    @patch('office2md.converters.pandoc_converter.PANDOC_AVAILABLE', True)
+    def test_start_reports_stderr_without_pipe(self):
+        """Test stderr goes to a file, not an undrained pipe, and is reported on failure."""
+        from office2md.converters.pandoc_converter import PandocServer
+
+        def fake_popen(args, stdout, stderr):
+            assert stderr is not subprocess.PIPE
+            stderr.write(b"port in use")
+            process = MagicMock()
+            process.poll.return_value = 1
+            return process
+
+        server = PandocServer(port=3030)
+        with patch('office2md.converters.pandoc_converter.subprocess.Popen', side_effect=fake_popen):
+            with pytest.raises(RuntimeError, match="port in use"):
+                server.start()
+
+        server.stop()
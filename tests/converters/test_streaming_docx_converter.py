@@ -0,0 +1,86 @@
+"""Tests for StreamingDocxConverter."""
+
+import pytest
+
+from office2md.converters.streaming_docx_converter import StreamingDocxConverter
+
+
+class TestStreamingDocxConverter:
+    """Test suite for StreamingDocxConverter."""
+
+    @pytest.fixture
+    def sample_docx(self, tmp_path):
+        """Create a sample DOCX file for testing."""
+        from docx import Document
+
+        doc_path = tmp_path / "test.docx"
+        doc = Document()
+
+        doc.add_heading("Test Document", level=1)
+
+        para = doc.add_paragraph()
+        para.add_run("This is ")
+        para.add_run("bold text").bold = True
+        para.add_run(" and ")
+        para.add_run("italic").italic = True
+
+        doc.add_paragraph("Item 1", style='List Bullet')
+
+        table = doc.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "Header 1"
+        table.cell(0, 1).text = "Header | 2"
+        table.cell(1, 0).text = "Data 1"
+        table.cell(1, 1).text = "Data 2"
+
+        doc.save(doc_path)
+        return doc_path
+
+    def test_convert_document(self, sample_docx):
+        """Test headings, inline formatting and lists."""
+        markdown = StreamingDocxConverter(str(sample_docx)).convert()
+
+        assert "# Test Document" in markdown
+        assert "This is **bold text** and *italic*" in markdown
+        assert "- Item 1" in markdown
+
+    def test_convert_table(self, sample_docx):
+        """Test table conversion escapes pipes."""
+        markdown = StreamingDocxConverter(str(sample_docx)).convert()
+
+        assert "| Header 1 | Header \\| 2 |" in markdown
+        assert "| --- | --- |" in markdown
+        assert "| Data 1 | Data 2 |" in markdown
+
+    def test_merged_table_matches_basic_converter(self, tmp_path):
+        """Test merged cells and breaks come out as in the python-docx converter."""
+        from docx import Document
+        from docx.enum.text import WD_BREAK
+
+        from office2md.converters.basic_docx_converter import BasicDocxConverter
+
+        doc_path = tmp_path / "merged.docx"
+        doc = Document()
+        table = doc.add_table(rows=3, cols=3)
+        for r in range(3):
+            for c in range(3):
+                table.cell(r, c).text = f"r{r}c{c}"
+        table.cell(0, 0).merge(table.cell(0, 1))
+        table.cell(1, 2).merge(table.cell(2, 2))
+        run = doc.add_paragraph().add_run("before")
+        run.add_break(WD_BREAK.PAGE)
+        run.add_text("after")
+        doc.save(doc_path)
+
+        markdown = StreamingDocxConverter(str(doc_path), skip_images=True).convert()
+
+        assert markdown == BasicDocxConverter(str(doc_path), skip_images=True).convert()
+        assert "| r0c0 r0c1 | r0c0 r0c1 | r0c2 |" in markdown
+        assert "beforeafter" in markdown
+
+    def test_convert_via_cli(self, sample_docx, tmp_path):
+        """Test --low-memory-docx routes through the streaming converter."""
+        from office2md.cli import convert_file
+
+        output_path = tmp_path / "output.md"
+        assert convert_file(str(sample_docx), str(output_path), low_memory_docx=True)
+        assert "# Test Document" in output_path.read_text()
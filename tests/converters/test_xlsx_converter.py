@@ -28,3 +28,50 @@ class TestXlsxConverter:
         output_file = tmp_path / "custom.md"
         converter = XlsxConverter(str(input_file), str(output_file))
         assert converter.output_path == output_file
+
+    @pytest.mark.parametrize("read_only", [True, False])
+    def test_convert_workbook(self, tmp_path, read_only):
+        """Test conversion in both read-only and full workbook modes."""
+        from openpyxl import Workbook
+
+        input_file = tmp_path / "data.xlsx"
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "Data"
+        worksheet.append(["Name", "Value"])
+        worksheet.append(["a", 1])
+        workbook.save(input_file)
+
+        converter = XlsxConverter(str(input_file), read_only=read_only)
+        markdown = converter.convert()
+
+        assert "## Data" in markdown
+        assert "| Name | Value |" in markdown
+        assert "| a | 1 |" in markdown
+
+    def test_convert_workbook_with_stale_dimension(self, tmp_path):
+        """Test read-only mode reads all rows when the sheet's dimension is stale."""
+        import zipfile
+
+        from openpyxl import Workbook
+
+        saved = tmp_path / "saved.xlsx"
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.append(["Name", "Value", "Unit"])
+        worksheet.append(["a", 1, "kg"])
+        workbook.save(saved)
+
+        # Rewrite the package with the sheet's dimension reduced to A1
+        input_file = tmp_path / "stale.xlsx"
+        with zipfile.ZipFile(saved) as src, zipfile.ZipFile(input_file, "w") as dst:
+            for item in src.infolist():
+                data = src.read(item)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    data = data.replace(b'<dimension ref="A1:C2"/>', b'<dimension ref="A1"/>')
+                dst.writestr(item, data)
+
+        markdown = XlsxConverter(str(input_file), read_only=True).convert()
+
+        assert "| Name | Value | Unit |" in markdown
+        assert "| a | 1 | kg |" in markdown
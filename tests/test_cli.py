@@ -4,7 +4,17 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from office2md.cli import parse_args, convert_file, batch_convert, main
+from office2md.cli import (
+    parse_args,
+    convert_file,
+    batch_convert,
+    main,
+    setup_logging,
+    _worker_logging_options,
+    _filter_kwargs,
+    _iter_pool_results,
+    _iter_supported,
+)
 
 
 class TestParseArgs:
@@ -41,6 +51,23 @@ class TestParseArgs:
         args = parse_args(["doc.pdf", "--use-docling"])
         assert args.use_docling is True
 
+    def test_force_ocr_flag(self):
+        """Test --force-ocr flag."""
+        assert parse_args(["doc.pdf", "--use-docling", "--force-ocr"]).force_ocr is True
+        assert parse_args(["doc.pdf"]).force_ocr is False
+
+    def test_pdf_backend_option(self):
+        """Test --pdf-backend choices and default."""
+        assert parse_args(["doc.pdf"]).pdf_backend == "pypdfium2"
+        assert parse_args(["doc.pdf", "--pdf-backend", "dlparse_v4"]).pdf_backend == "dlparse_v4"
+        with pytest.raises(SystemExit):
+            parse_args(["doc.pdf", "--pdf-backend", "pdfminer"])
+
+    def test_ocr_jobs_option(self):
+        """Test --ocr-jobs option."""
+        assert parse_args(["doc.pdf"]).ocr_jobs == 1
+        assert parse_args(["doc.pdf", "--use-docling", "--ocr-jobs", "4"]).ocr_jobs == 4
+
     def test_no_mammoth_flag(self):
         """Test --no-mammoth flag."""
         args = parse_args(["doc.docx", "--no-mammoth"])
@@ -51,6 +78,11 @@ class TestParseArgs:
         args = parse_args(["doc.docx", "--embed-images"])
         assert args.embed_images is True
 
+    def test_low_memory_docx_flag(self):
+        """Test --low-memory-docx flag."""
+        args = parse_args(["doc.docx", "--low-memory-docx"])
+        assert args.low_memory_docx is True
+
     def test_skip_images_flag(self):
         """Test --skip-images flag."""
         args = parse_args(["doc.docx", "--skip-images"])
@@ -61,11 +93,41 @@ class TestParseArgs:
         args = parse_args(["data.xlsx", "--first-sheet-only"])
         assert args.first_sheet_only is True
 
+    def test_xlsx_read_only_default(self):
+        """Test XLSX read-only mode is on by default."""
+        assert parse_args(["data.xlsx"]).xlsx_read_only is True
+
+    def test_xlsx_full_mode_flag(self):
+        """Test --xlsx-full-mode disables read-only mode."""
+        args = parse_args(["data.xlsx", "--xlsx-full-mode"])
+        assert args.xlsx_read_only is False
+
     def test_no_notes_flag(self):
         """Test --no-notes flag."""
         args = parse_args(["slides.pptx", "--no-notes"])
         assert args.no_notes is True
 
+    def test_jobs_option(self):
+        """Test -j/--jobs option."""
+        args = parse_args(["--batch", "./input", "--jobs", "4"])
+        assert args.jobs == 4
+
+    def test_executor_option(self):
+        """Test --executor option."""
+        assert parse_args(["--batch", "./input"]).executor == "process"
+        args = parse_args(["--batch", "./input", "--executor", "thread"])
+        assert args.executor == "thread"
+
+    def test_pandoc_server_flag(self):
+        """Test --pandoc-server flag."""
+        args = parse_args(["--batch", "./input", "--pandoc-server"])
+        assert args.pandoc_server is True
+
+    def test_force_flag(self):
+        """Test --force flag."""
+        assert parse_args(["--batch", "./docs"]).force is False
+        assert parse_args(["--batch", "./docs", "--force"]).force is True
+
     def test_verbose_flag(self):
         """Test -v/--verbose flag."""
         args = parse_args(["doc.docx", "-v"])
@@ -99,6 +161,19 @@ class TestConvertFile:
         result = convert_file(str(tmp_path / "nonexistent.docx"))
         assert result is False
 
+    def test_convert_xlsx_via_factory(self, tmp_path):
+        """Test non-DOCX files are dispatched through ConverterFactory."""
+        from openpyxl import Workbook
+        
+        xlsx_path = tmp_path / "data.xlsx"
+        wb = Workbook()
+        wb.active.append(["Name", "Value"])
+        wb.save(xlsx_path)
+        
+        output_path = tmp_path / "data.md"
+        assert convert_file(str(xlsx_path), str(output_path)) is True
+        assert "Name" in output_path.read_text()
+
     @patch('office2md.converters.pandoc_converter.PANDOC_AVAILABLE', True)
     @patch('subprocess.run')
     def test_convert_with_pandoc(self, mock_run, sample_docx, tmp_path):
@@ -148,6 +223,82 @@ class TestBatchConvert:
         assert failure == 0
         assert (output_dir / "doc0.md").exists()
 
+    def test_batch_convert_sequential(self, batch_input, tmp_path):
+        """Test batch converting with a single job."""
+        output_dir = tmp_path / "output"
+        success, failure = batch_convert(str(batch_input), str(output_dir), jobs=1)
+        
+        assert success == 3
+        assert failure == 0
+        assert (output_dir / "doc2.md").exists()
+
+    def test_batch_convert_threads(self, batch_input, tmp_path):
+        """Test batch converting with a thread pool."""
+        output_dir = tmp_path / "output"
+        success, failure = batch_convert(
+            str(batch_input), str(output_dir), jobs=2, executor="thread"
+        )
+        
+        assert success == 3
+        assert failure == 0
+
+    def test_batch_convert_async(self, batch_input, tmp_path):
+        """Test batch converting on an asyncio event loop."""
+        output_dir = tmp_path / "output"
+        success, failure = batch_convert(
+            str(batch_input), str(output_dir), jobs=2, executor="async"
+        )
+        
+        assert success == 3
+        assert failure == 0
+        assert (output_dir / "doc1.md").exists()
+
+    def test_batch_convert_skips_mismatched_content(self, batch_input, tmp_path):
+        """Test files whose content does not match their extension are skipped."""
+        (batch_input / "~$doc0.docx").write_bytes(b"lock file")
+        
+        output_dir = tmp_path / "output"
+        success, failure = batch_convert(str(batch_input), str(output_dir), jobs=1)
+        
+        assert success == 3
+        assert failure == 0
+
+    def test_batch_convert_skips_up_to_date(self, batch_input, tmp_path):
+        """Test outputs newer than their input are not converted again."""
+        output_dir = tmp_path / "output"
+        batch_convert(str(batch_input), str(output_dir), jobs=1)
+        (output_dir / "doc0.md").write_text("kept")
+        
+        success, failure = batch_convert(str(batch_input), str(output_dir), jobs=1)
+        
+        assert success == 0
+        assert failure == 0
+        assert (output_dir / "doc0.md").read_text() == "kept"
+
+    def test_batch_convert_force(self, batch_input, tmp_path):
+        """Test force=True re-converts up-to-date outputs."""
+        output_dir = tmp_path / "output"
+        batch_convert(str(batch_input), str(output_dir), jobs=1)
+        (output_dir / "doc0.md").write_text("stale")
+        
+        success, failure = batch_convert(
+            str(batch_input), str(output_dir), jobs=1, force=True
+        )
+        
+        assert success == 3
+        assert "Document 0" in (output_dir / "doc0.md").read_text()
+
+    @patch('office2md.converters.pandoc_converter.PANDOC_AVAILABLE', False)
+    def test_batch_convert_pandoc_server_fallback(self, batch_input, tmp_path):
+        """Test batches still convert when the Pandoc server cannot start."""
+        output_dir = tmp_path / "output"
+        success, failure = batch_convert(
+            str(batch_input), str(output_dir), jobs=1, pandoc_server=True
+        )
+        
+        assert success == 3
+        assert failure == 0
+
     def test_batch_convert_empty_directory(self, tmp_path):
         """Test batch converting empty directory."""
         empty_dir = tmp_path / "empty"
@@ -164,6 +315,108 @@ class TestBatchConvert:
         assert failure == 1
 
 
+class TestIterSupported:
+    """Test _iter_supported file discovery."""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        """Create a small directory tree."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.docx").write_bytes(b"")
+        (tmp_path / "B.XLSX").write_bytes(b"")
+        (tmp_path / "notes.txt").write_bytes(b"")
+        (tmp_path / "sub" / "c.pptx").write_bytes(b"")
+        return tmp_path
+
+    def test_flat(self, tree):
+        """Test non-recursive discovery skips subdirectories."""
+        names = sorted(p.name for p in _iter_supported(tree))
+        assert names == ["B.XLSX", "a.docx"]
+
+    def test_recursive(self, tree):
+        """Test recursive discovery descends into subdirectories."""
+        names = sorted(p.name for p in _iter_supported(tree, recursive=True))
+        assert names == ["B.XLSX", "a.docx", "c.pptx"]
+
+
+class TestIterPoolResults:
+    """Test _iter_pool_results."""
+
+    def test_yields_in_completion_order(self):
+        """Test a slow early job does not hold back later results."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        
+        release_slow = threading.Event()
+        
+        def fake_worker(task):
+            if task == "slow":
+                release_slow.wait(timeout=5)
+                return False
+            return True
+        
+        results = []
+        with patch("office2md.cli._convert_worker", side_effect=fake_worker):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                for result in _iter_pool_results(pool, ["slow", "fast"], max_pending=4):
+                    results.append(result)
+                    release_slow.set()
+        
+        assert results == [True, False]
+
+
+class TestFilterKwargs:
+    """Test per-extension option filtering."""
+
+    def test_drops_options_for_other_formats(self):
+        """Test options for other formats are dropped."""
+        kwargs = {"skip_images": True, "include_notes": False, "use_pandoc": True}
+        
+        assert _filter_kwargs(".docx", kwargs) == {"skip_images": True, "use_pandoc": True}
+        assert _filter_kwargs(".pptx", kwargs) == {"skip_images": True, "include_notes": False}
+
+    def test_unknown_extension_keeps_everything(self):
+        """Test unknown extensions receive all options."""
+        kwargs = {"skip_images": True, "include_notes": False}
+        assert _filter_kwargs(".pdf", kwargs) == kwargs
+
+
+class TestSetupLogging:
+    """Test setup_logging."""
+
+    def test_repeated_calls_do_not_add_handlers(self):
+        """Test calling setup_logging twice keeps one set of handlers."""
+        import logging
+        
+        root = logging.getLogger()
+        original_level = root.level
+        try:
+            setup_logging()
+            handlers = list(root.handlers)
+            
+            setup_logging(verbose=True)
+            
+            assert root.handlers == handlers
+            assert root.level == logging.DEBUG
+        finally:
+            root.setLevel(original_level)
+
+    def test_worker_logging_options(self):
+        """Test process workers re-run setup_logging with the parent's level."""
+        import logging
+        
+        root = logging.getLogger()
+        original_level = root.level
+        try:
+            setup_logging(verbose=True)
+            options = _worker_logging_options()
+            
+            assert options["initializer"] is setup_logging
+            assert options["initargs"] == (True,)
+        finally:
+            root.setLevel(original_level)
+
+
 class TestMain:
     """Test main CLI function."""
 
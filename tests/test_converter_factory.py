@@ -3,7 +3,12 @@
 
 import pytest
 
-from office2md.converter_factory import ConverterFactory
+from office2md.converter_factory import (
+    SUPPORTED_EXTS,
+    ConverterFactory,
+    FileKind,
+    detect_file_kind,
+)
 
 
 class TestConverterFactory:
@@ -35,9 +40,70 @@ class TestConverterFactory:
         assert not ConverterFactory.is_supported("test.txt")
         assert not ConverterFactory.is_supported("test.doc")
 
+    def test_supported_exts_matches_factory(self):
+        """Test that SUPPORTED_EXTS mirrors the factory mapping."""
+        assert SUPPORTED_EXTS == frozenset(ConverterFactory.SUPPORTED_EXTENSIONS)
+
+    def test_get_converter_class_resolves_lazily(self):
+        """Test registered converter paths resolve to classes."""
+        from office2md.converters.xlsx_converter import XlsxConverter
+
+        assert ConverterFactory.get_converter_class(".xlsx") is XlsxConverter
+        assert ConverterFactory.get_converter_class(".txt") is None
+
+    def test_import_does_not_load_backends(self):
+        """Test importing the factory leaves format libraries unloaded."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, office2md.converter_factory; "
+            "print(sorted(m for m in ('docx', 'openpyxl', 'pptx') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
     def test_create_converter_unsupported_type(self, tmp_path):
         """Test that ValueError is raised for unsupported file types."""
         test_file = tmp_path / "test.pdf"
         test_file.write_text("test")
         with pytest.raises(ValueError, match="Unsupported file type"):
             ConverterFactory.create_converter(str(test_file))
+
+    def test_is_supported_ignores_case_and_dotted_dirs(self):
+        """Test extension parsing without Path."""
+        assert ConverterFactory.is_supported("REPORT.DOCX")
+        assert not ConverterFactory.is_supported("archive.docx/readme")
+        assert not ConverterFactory.is_supported("dir/.docx")
+
+    def test_create_converter_with_extension(self, tmp_path):
+        """Test a precomputed extension takes precedence over the path."""
+        from office2md.converters.xlsx_converter import XlsxConverter
+
+        converter = ConverterFactory.create_converter(
+            str(tmp_path / "data"), extension=".xlsx"
+        )
+        assert isinstance(converter, XlsxConverter)
+
+
+class TestDetectFileKind:
+    """Test detect_file_kind magic-byte classification."""
+
+    @pytest.mark.parametrize("header, kind", [
+        (b"PK\x03\x04rest", FileKind.ZIP),
+        (b"%PDF-1.7", FileKind.PDF),
+        (b"\xd0\xcf\x11\xe0\xa1\xb1", FileKind.OLE),
+        (b"hello", FileKind.UNKNOWN),
+        (b"", FileKind.UNKNOWN),
+    ])
+    def test_detects_header(self, tmp_path, header, kind):
+        """Test each known header maps to its kind."""
+        path = tmp_path / "file.bin"
+        path.write_bytes(header)
+        assert detect_file_kind(path) is kind
+
+    def test_missing_file(self, tmp_path):
+        """Test unreadable files are UNKNOWN."""
+        assert detect_file_kind(tmp_path / "missing.docx") is FileKind.UNKNOWN